@@ -263,6 +263,40 @@ func buildDebugShimScript(apiBaseURL string) string {
 	return strings.ReplaceAll(shimScriptTemplate, "__APP_SERVER_BASE_URL__", apiBaseURL)
 }
 
+// shimmedIndex 缓存注入 shim 后的 index.html。
+//
+// 以文件 mtime + size 为键: 前端重新构建后下一次请求自动重建, 其余请求
+// 只做一次 os.Stat, 不再重复读盘和整页字符串替换。
+type shimmedIndex struct {
+	path       string
+	shimScript string
+
+	mu      sync.Mutex
+	modTime time.Time
+	size    int64
+	html    []byte
+}
+
+// load 返回注入 shim 后的 HTML; 文件未变化时直接复用缓存。
+func (idx *shimmedIndex) load() ([]byte, error) {
+	info, err := os.Stat(idx.path)
+	if err != nil {
+		return nil, err
+	}
+	idx.mu.Lock()
+	defer idx.mu.Unlock()
+	if idx.html != nil && idx.modTime.Equal(info.ModTime()) && idx.size == info.Size() {
+		return idx.html, nil
+	}
+	data, err := os.ReadFile(idx.path)
+	if err != nil {
+		return nil, err
+	}
+	html := strings.Replace(string(data), "</head>", idx.shimScript+"\n</head>", 1)
+	idx.modTime, idx.size, idx.html = info.ModTime(), info.Size(), []byte(html)
+	return idx.html, nil
+}
+
 // startDebugServer 启动调试 HTTP 服务器, 提供前端静态文件。
 func startDebugServer(ctx context.Context, uiPort int, apiBaseURL string) {
 	// 查找 frontend 目录
@@ -294,19 +328,21 @@ func startDebugServer(ctx context.Context, uiPort int, apiBaseURL string) {
 
 	// 注入 shim 的 index.html handler
 	// serveIndexWithShim 读取 dist/index.html 并注入 shim 脚本
+	index := &shimmedIndex{path: filepath.Join(distDir, "index.html"), shimScript: buildDebugShimScript(apiBaseURL)}
 	serveIndexWithShim := func(w http.ResponseWriter, _ *http.Request) {
-		data, err := os.ReadFile(filepath.Join(distDir, "index.html"))
+		html, err := index.load()
 		if err != nil {
 			http.Error(w, "dist/index.html not found — run 'npm run build:react'", 404)
 			return
 		}
-		html := string(data)
-		shimScript := buildDebugShimScript(apiBaseURL)
-		html = strings.Replace(html, "</head>", shimScript+"\n</head>", 1)
 		w.Header().Set("Content-Type", "text/html; charset=utf-8")
-		_, _ = fmt.Fprint(w, html)
+		_, _ = w.Write(html)
 	}
 
+	// 静态文件 handler 只建一次; http.FileServer 经 io.Copy → TCPConn.ReadFrom
+	// 在 Linux 上走 sendfile 零拷贝, 不把文件读入用户态缓冲。
+	staticFiles := http.FileServer(http.Dir(distDir))
+
 	// SPA 路由回退: 静态文件优先, 不存在则返回 index.html
 	mux.HandleFunc("/", func(w http.ResponseWriter, r *http.Request) {
 		w.Header().Set("Cache-Control", "no-store, no-cache, must-revalidate")
@@ -320,7 +356,7 @@ func startDebugServer(ctx context.Context, uiPort int, apiBaseURL string) {
 		// 尝试 dist/ 中的静态文件
 		filePath := filepath.Join(distDir, filepath.Clean(r.URL.Path))
 		if _, err := os.Stat(filePath); err == nil {
-			http.FileServer(http.Dir(distDir)).ServeHTTP(w, r)
+			staticFiles.ServeHTTP(w, r)
 			return
 		}
 		// SPA fallback: 路径不匹配静态文件 → 返回 index.html (React Router 处理)
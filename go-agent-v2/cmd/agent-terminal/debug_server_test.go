@@ -2,6 +2,9 @@ package main
 
 import (
 	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"strings"
 	"testing"
 	"time"
 )
@@ -235,3 +238,38 @@ func TestPublishDebugBridgeEvent_DroppableSkipMetric(t *testing.T) {
 		t.Fatalf("expected droppableSkipTotal=10, got %d", skipTotal)
 	}
 }
+
+func TestShimmedIndex_CachesUntilFileChanges(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "index.html")
+	if err := os.WriteFile(path, []byte("<head></head>v1"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	idx := &shimmedIndex{path: path, shimScript: "<script>shim</script>"}
+
+	first, err := idx.load()
+	if err != nil {
+		t.Fatalf("load: %v", err)
+	}
+	if !strings.Contains(string(first), "<script>shim</script>\n</head>") {
+		t.Fatalf("shim not injected: %q", first)
+	}
+	second, _ := idx.load()
+	if &first[0] != &second[0] {
+		t.Fatal("unchanged index.html should reuse cached html")
+	}
+
+	if err := os.WriteFile(path, []byte("<head></head>v2-rebuilt"), 0o644); err != nil {
+		t.Fatal(err)
+	}
+	third, _ := idx.load()
+	if !strings.HasSuffix(string(third), "v2-rebuilt") {
+		t.Fatalf("rebuilt index.html not picked up: %q", third)
+	}
+}
+
+func TestShimmedIndex_MissingFile(t *testing.T) {
+	idx := &shimmedIndex{path: filepath.Join(t.TempDir(), "index.html")}
+	if _, err := idx.load(); err == nil {
+		t.Fatal("expected error for missing index.html")
+	}
+}
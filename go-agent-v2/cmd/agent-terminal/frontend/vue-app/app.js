@@ -13,6 +13,16 @@ import { useThreadStore } from './stores/threads.js';
 
 const REFRESH_INTERVAL_MS = 10000;
 
+// 各页面在 ui/dashboard/get 响应中对应的列表字段。
+const DASHBOARD_PAGE_KEYS = Object.freeze({
+  agents: ['agents'],
+  dags: ['dags'],
+  tasks: ['taskAcks', 'taskTraces'],
+  skills: ['skills'],
+  commands: ['commandCards', 'prompts'],
+  memory: ['memory'],
+});
+
 const NAV_ITEMS = Object.freeze([
   { key: 'chat', icon: '💬', label: 'Chat' },
   { key: 'agents', icon: 'A', label: 'Agent' },
@@ -146,17 +156,15 @@ export const AppRoot = {
       page.value = 'chat';
     }
 
+    // 只覆盖目标页面自己的字段: 其它页面保留上次结果, 切回时先显示旧数据再刷新,
+    // 迟到的响应也不会清空别的页面。
     async function refreshDashboardByPage(targetPage) {
-      if (targetPage === 'chat' || targetPage === 'settings') return;
+      const keys = DASHBOARD_PAGE_KEYS[targetPage];
+      if (!keys) return;
       const res = await callAPI('ui/dashboard/get', { page: targetPage });
-      dashboard.agents = Array.isArray(res?.agents) ? res.agents : [];
-      dashboard.dags = Array.isArray(res?.dags) ? res.dags : [];
-      dashboard.taskAcks = Array.isArray(res?.taskAcks) ? res.taskAcks : [];
-      dashboard.taskTraces = Array.isArray(res?.taskTraces) ? res.taskTraces : [];
-      dashboard.skills = Array.isArray(res?.skills) ? res.skills : [];
-      dashboard.commandCards = Array.isArray(res?.commandCards) ? res.commandCards : [];
-      dashboard.prompts = Array.isArray(res?.prompts) ? res.prompts : [];
-      dashboard.memory = Array.isArray(res?.memory) ? res.memory : [];
+      for (const key of keys) {
+        dashboard[key] = Array.isArray(res?.[key]) ? res[key] : [];
+      }
     }
 
     async function bootstrap() {
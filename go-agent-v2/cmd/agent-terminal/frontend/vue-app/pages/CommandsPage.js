@@ -9,8 +9,7 @@ export const CommandsPage = {
         promptFields: { type: Array, default: () => [] },
     },
     emits: ['run-command', 'run-prompt'],
-    setup(_props, { emit }) {
-        void _props;
+    setup(props, { emit }) {
         function onRunCommand(item) {
             logDebug('page', 'commands.runCommand.click', {});
             emit('run-command', item);
@@ -21,9 +20,26 @@ export const CommandsPage = {
             emit('run-prompt', item);
         }
 
+        // 列表级事件委托: 每个列表只挂一个 click 监听, 由按钮的 data-idx 定位条目
+        function delegatedItem(event, items) {
+            const button = event.target?.closest?.('[data-action="run"]');
+            if (!button) return null;
+            return items[Number(button.dataset.idx)] || null;
+        }
+
+        function onCommandListClick(event) {
+            const item = delegatedItem(event, props.commandCards);
+            if (item) onRunCommand(item);
+        }
+
+        function onPromptListClick(event) {
+            const item = delegatedItem(event, props.prompts);
+            if (item) onRunPrompt(item);
+        }
+
         return {
-            onRunCommand,
-            onRunPrompt,
+            onCommandListClick,
+            onPromptListClick,
         };
     },
     template: `
@@ -40,7 +56,7 @@ export const CommandsPage = {
               <div class="es-icon">C</div>
               <h3>暂无命令卡</h3>
             </div>
-            <div v-else class="data-list-vue" data-testid="commands-list">
+            <div v-else class="data-list-vue" data-testid="commands-list" @click="onCommandListClick">
               <article
                 v-for="(item, idx) in commandCards"
                 :key="item.card_key || ('cmd-' + idx)"
@@ -52,7 +68,7 @@ export const CommandsPage = {
                   <span>{{ item[field.key] ?? '-' }}</span>
                 </div>
                 <div class="data-actions-vue">
-                  <button class="btn btn-ghost btn-xs" :data-testid="'command-run-button-' + idx" @click="onRunCommand(item)">发送到当前会话</button>
+                  <button class="btn btn-ghost btn-xs" data-action="run" :data-idx="idx" :data-testid="'command-run-button-' + idx">发送到当前会话</button>
                 </div>
               </article>
             </div>
@@ -66,7 +82,7 @@ export const CommandsPage = {
               <div class="es-icon">P</div>
               <h3>暂无提示词</h3>
             </div>
-            <div v-else class="data-list-vue" data-testid="prompts-list">
+            <div v-else class="data-list-vue" data-testid="prompts-list" @click="onPromptListClick">
               <article
                 v-for="(item, idx) in prompts"
                 :key="item.prompt_key || ('prompt-' + idx)"
@@ -78,7 +94,7 @@ export const CommandsPage = {
                   <span>{{ item[field.key] ?? '-' }}</span>
                 </div>
                 <div class="data-actions-vue">
-                  <button class="btn btn-ghost btn-xs" :data-testid="'prompt-run-button-' + idx" @click="onRunPrompt(item)">发送到当前会话</button>
+                  <button class="btn btn-ghost btn-xs" data-action="run" :data-idx="idx" :data-testid="'prompt-run-button-' + idx">发送到当前会话</button>
                 </div>
               </article>
             </div>
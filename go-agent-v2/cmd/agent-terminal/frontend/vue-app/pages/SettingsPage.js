@@ -1,6 +1,6 @@
 import { computed, onBeforeUnmount, onMounted, reactive, ref } from '../../lib/vue.esm-browser.prod.js';
 import { callAPI } from '../services/api.js';
-import { logInfo, readLogBuffer, readLogLevel } from '../services/log.js';
+import { logInfo, onLogChange, readLogBuffer, readLogLevel } from '../services/log.js';
 
 export const SettingsPage = {
   name: 'SettingsPage',
@@ -10,6 +10,7 @@ export const SettingsPage = {
   emits: ['refresh'],
   setup(props, { emit }) {
     const LOG_LIST_LIMIT = 14;
+    const LOG_REFRESH_DELAY_MS = 200;
     const versionText = computed(() => `Agent Orchestrator ${props.buildInfo.version || 'dev'}`);
     const runtimeText = computed(() => props.buildInfo.runtime
       ? `Wails WebKit · Go Backend · ${props.buildInfo.runtime}`
@@ -25,6 +26,7 @@ export const SettingsPage = {
     const lspPromptNotice = reactive({ level: 'info', message: '' });
 
     let logRefreshTimer = 0;
+    let unsubscribeLogChange = () => { };
 
     // Turn Tracker 设置
     const stallThreshold = ref(480);
@@ -45,6 +47,15 @@ export const SettingsPage = {
       logEntries.value = buffer.slice(-LOG_LIST_LIMIT).reverse();
     }
 
+    // 日志推送触发: 窗口内的多条日志合并为一次刷新, 无新日志时不做任何工作。
+    function scheduleLogPanelRefresh() {
+      if (logRefreshTimer) return;
+      logRefreshTimer = window.setTimeout(() => {
+        logRefreshTimer = 0;
+        refreshLogPanel();
+      }, LOG_REFRESH_DELAY_MS);
+    }
+
     function setLSPPromptNotice(level, message) {
       lspPromptNotice.level = level || 'info';
       lspPromptNotice.message = (message || '').toString().trim();
@@ -147,11 +158,13 @@ export const SettingsPage = {
       refreshLogPanel();
       loadLSPPromptHint();
       loadStallSettings();
-      logRefreshTimer = window.setInterval(refreshLogPanel, 1000);
+      unsubscribeLogChange = onLogChange(scheduleLogPanelRefresh);
     });
     onBeforeUnmount(() => {
+      unsubscribeLogChange();
       if (logRefreshTimer) {
-        window.clearInterval(logRefreshTimer);
+        window.clearTimeout(logRefreshTimer);
+        logRefreshTimer = 0;
       }
       logInfo('page', 'settings.unmounted', {});
     });
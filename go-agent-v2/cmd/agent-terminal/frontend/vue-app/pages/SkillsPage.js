@@ -1,4 +1,4 @@
-import { computed, nextTick, reactive, ref, watch } from '../../lib/vue.esm-browser.prod.js';
+import { computed, nextTick, onBeforeUnmount, reactive, ref, watch } from '../../lib/vue.esm-browser.prod.js';
 import { callAPI, selectProjectDirs } from '../services/api.js';
 import { logDebug, logInfo, logWarn } from '../services/log.js';
 import { renderAssistantMarkdown } from '../utils/assistant-markdown.js';
@@ -170,6 +170,9 @@ export const SkillsPage = {
     const uploading = ref(false);
     const deletingSkillName = ref('');
     const searchQuery = ref('');
+    // 过滤只跟随停顿后的关键词: 连续输入时不逐字重算整张列表
+    const appliedSearchQuery = ref('');
+    let searchApplyTimer = 0;
     const isEditorOpen = ref(false);
     const isBodyEditing = ref(false);
     const bodyEditorFocused = ref(false);
@@ -186,34 +189,56 @@ export const SkillsPage = {
 
     const skillCards = computed(() => {
       const list = Array.isArray(props.skills) ? props.skills : [];
-      return list.map((item) => ({
-        name: (item?.name || '').toString(),
-        dir: (item?.dir || '').toString(),
-        description: (item?.description || '').toString(),
-        summary: (item?.summary || item?.description || '').toString(),
-        triggerWords: Array.isArray(item?.trigger_words) ? item.trigger_words : [],
-        forceWords: Array.isArray(item?.force_words) ? item.force_words : [],
-      }));
-    });
-
-    const filteredSkillCards = computed(() => {
-      const keyword = (searchQuery.value || '').toString().trim().toLowerCase();
-      if (!keyword) return skillCards.value;
-      return skillCards.value.filter((item) => {
-        const haystack = [
-          item.name,
-          item.description,
-          item.summary,
-          item.dir,
-          ...(Array.isArray(item.triggerWords) ? item.triggerWords : []),
-          ...(Array.isArray(item.forceWords) ? item.forceWords : []),
+      return list.map((item) => {
+        const card = {
+          name: (item?.name || '').toString(),
+          dir: (item?.dir || '').toString(),
+          description: (item?.description || '').toString(),
+          summary: (item?.summary || item?.description || '').toString(),
+          triggerWords: Array.isArray(item?.trigger_words) ? item.trigger_words : [],
+          forceWords: Array.isArray(item?.force_words) ? item.force_words : [],
+        };
+        // 搜索文本随列表刷新构建一次, 过滤时不再逐项拼接/转小写
+        card.searchText = [
+          card.name,
+          card.description,
+          card.summary,
+          card.dir,
+          ...card.triggerWords,
+          ...card.forceWords,
         ]
           .join(' ')
           .toLowerCase();
-        return haystack.includes(keyword);
+        return card;
       });
     });
 
+    watch(searchQuery, (next) => {
+      if (searchApplyTimer) window.clearTimeout(searchApplyTimer);
+      const keyword = (next || '').toString().trim().toLowerCase();
+      if (!keyword) {
+        // 清空立即生效
+        searchApplyTimer = 0;
+        appliedSearchQuery.value = '';
+        return;
+      }
+      searchApplyTimer = window.setTimeout(() => {
+        searchApplyTimer = 0;
+        appliedSearchQuery.value = keyword;
+      }, 200);
+    });
+
+    onBeforeUnmount(() => {
+      if (searchApplyTimer) window.clearTimeout(searchApplyTimer);
+      searchApplyTimer = 0;
+    });
+
+    const filteredSkillCards = computed(() => {
+      const keyword = appliedSearchQuery.value;
+      if (!keyword) return skillCards.value;
+      return skillCards.value.filter((item) => item.searchText.includes(keyword));
+    });
+
     const summarySourceLabel = computed(() => {
       const source = (summarySource.value || '').toLowerCase();
       if (source === 'frontmatter') return '用户摘要';
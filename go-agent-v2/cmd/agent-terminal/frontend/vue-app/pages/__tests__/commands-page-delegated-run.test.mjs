@@ -0,0 +1,15 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+
+const COMMANDS_PAGE_JS_PATH = new URL('../CommandsPage.js', import.meta.url);
+
+test('CommandsPage delegates run buttons to one listener per list', async () => {
+  const src = await fs.readFile(COMMANDS_PAGE_JS_PATH, 'utf8');
+
+  assert.equal(src.includes('data-testid="commands-list" @click="onCommandListClick"'), true);
+  assert.equal(src.includes('data-testid="prompts-list" @click="onPromptListClick"'), true);
+  assert.equal(src.includes('data-action="run" :data-idx="idx"'), true);
+  assert.equal(src.includes('@click="onRunCommand(item)"'), false);
+  assert.equal(src.includes('@click="onRunPrompt(item)"'), false);
+});
@@ -0,0 +1,22 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+
+const SETTINGS_PAGE_JS_PATH = new URL('../SettingsPage.js', import.meta.url);
+const LOG_SERVICE_JS_PATH = new URL('../../services/log.js', import.meta.url);
+
+test('SettingsPage refreshes the log panel on log changes instead of polling', async () => {
+  const src = await fs.readFile(SETTINGS_PAGE_JS_PATH, 'utf8');
+
+  assert.equal(src.includes('setInterval(refreshLogPanel'), false);
+  assert.equal(src.includes('unsubscribeLogChange = onLogChange(scheduleLogPanelRefresh);'), true);
+  assert.equal(src.includes('if (logRefreshTimer) return;'), true);
+  assert.equal(src.includes('unsubscribeLogChange();'), true);
+});
+
+test('log service notifies listeners when the buffer changes', async () => {
+  const src = await fs.readFile(LOG_SERVICE_JS_PATH, 'utf8');
+
+  assert.equal(src.includes('export function onLogChange(listener)'), true);
+  assert.equal(src.includes('  pushBuffer(entry);\n  consoleWrite(normalizedLevel, `${entry.scope}.${entry.event}`, entry);\n  notifyChange();'), true);
+});
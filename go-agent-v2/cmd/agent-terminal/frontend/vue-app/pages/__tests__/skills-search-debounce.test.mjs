@@ -0,0 +1,14 @@
+import test from 'node:test';
+import assert from 'node:assert/strict';
+import fs from 'node:fs/promises';
+
+const SKILLS_PAGE_JS_PATH = new URL('../SkillsPage.js', import.meta.url);
+
+test('SkillsPage filters on the debounced keyword with prebuilt search text', async () => {
+  const src = await fs.readFile(SKILLS_PAGE_JS_PATH, 'utf8');
+
+  assert.equal(src.includes('const appliedSearchQuery = ref(\'\');'), true);
+  assert.equal(src.includes('const keyword = appliedSearchQuery.value;'), true);
+  assert.equal(src.includes('filter((item) => item.searchText.includes(keyword))'), true);
+  assert.equal(src.includes('if (searchApplyTimer) window.clearTimeout(searchApplyTimer);'), true);
+});
@@ -12,6 +12,7 @@ const LOG_PREFIX = '[AO]';
 let sequence = 0;
 let currentLevel = resolveInitialLevel();
 const ringBuffer = [];
+const changeListeners = new Set();
 
 function resolveInitialLevel() {
   try {
@@ -80,6 +81,16 @@ function pushBuffer(entry) {
   }
 }
 
+function notifyChange() {
+  for (const listener of changeListeners) {
+    try {
+      listener();
+    } catch {
+      // ignore
+    }
+  }
+}
+
 function consoleWrite(level, message, entry) {
   const method = level === 'debug'
     ? 'debug'
@@ -105,6 +116,7 @@ function emit(level, scope, event, fields = {}) {
   };
   pushBuffer(entry);
   consoleWrite(normalizedLevel, `${entry.scope}.${entry.event}`, entry);
+  notifyChange();
 }
 
 export function logDebug(scope, event, fields = {}) {
@@ -140,6 +152,7 @@ function setLogLevel(level) {
   } catch {
     // ignore
   }
+  notifyChange();
   logInfo('log', 'level.changed', { level: normalized });
   return true;
 }
@@ -154,12 +167,20 @@ export function readLogBuffer() {
 
 function clearLogBuffer() {
   ringBuffer.splice(0, ringBuffer.length);
+  notifyChange();
 }
 
 export function clearLogHistory() {
   clearLogBuffer();
 }
 
+// 订阅日志缓冲变化 (新条目 / 清空), 返回取消订阅函数; 监听方自行合并刷新。
+export function onLogChange(listener) {
+  if (typeof listener !== 'function') return () => { };
+  changeListeners.add(listener);
+  return () => changeListeners.delete(listener);
+}
+
 if (typeof window !== 'undefined') {
   window.AOLog = {
     getLevel: getLogLevel,
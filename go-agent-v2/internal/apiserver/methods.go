@@ -6,12 +6,36 @@ package apiserver
 import (
 	"context"
 	"encoding/json"
-	"regexp"
 
 	"github.com/multi-agent/go-agent-v2/pkg/logger"
 )
 
-var codexThreadIDPattern = regexp.MustCompile(`^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$`)
+// codexThreadIDLen 小写 UUID 形式的 codex thread id 长度 (8-4-4-4-12)。
+const codexThreadIDLen = 36
+
+// isCodexThreadIDFormat 判断 id 是否为小写 UUID (等价于
+// ^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$)。
+//
+// 格式定长, 逐字节比对即可, 不必每次进正则引擎。
+func isCodexThreadIDFormat(id string) bool {
+	if len(id) != codexThreadIDLen {
+		return false
+	}
+	for i := 0; i < len(id); i++ {
+		c := id[i]
+		switch i {
+		case 8, 13, 18, 23:
+			if c != '-' {
+				return false
+			}
+		default:
+			if (c < '0' || c > '9') && (c < 'a' || c > 'f') {
+				return false
+			}
+		}
+	}
+	return true
+}
 
 const (
 	defaultLSPUsagePromptHint = "已注入 LSP/Playwright/json-render/code_run 工具。使用规则：\n" +
@@ -172,6 +172,7 @@ func (s *Server) configLSPPromptHintWriteTyped(ctx context.Context, p configLSPP
 	if err := s.prefManager.Set(ctx, prefKeyLSPUsagePromptHint, normalized); err != nil {
 		return nil, err
 	}
+	s.invalidateLSPUsagePromptHint()
 	return map[string]any{
 		"ok":           true,
 		"hint":         s.resolveLSPUsagePromptHint(ctx),
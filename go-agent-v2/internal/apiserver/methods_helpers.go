@@ -91,7 +91,7 @@ func isLikelyCodexThreadID(raw string) bool {
 		return false
 	}
 	id = strings.TrimPrefix(strings.ToLower(id), "urn:uuid:")
-	return codexThreadIDPattern.MatchString(id)
+	return isCodexThreadIDFormat(id)
 }
 
 func normalizeCodexThreadID(raw string) string {
@@ -100,7 +100,7 @@ func normalizeCodexThreadID(raw string) string {
 		return ""
 	}
 	id = strings.TrimPrefix(strings.ToLower(id), "urn:uuid:")
-	if !codexThreadIDPattern.MatchString(id) {
+	if !isCodexThreadIDFormat(id) {
 		return ""
 	}
 	return id
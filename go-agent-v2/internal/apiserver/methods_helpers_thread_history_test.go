@@ -27,3 +27,24 @@ func TestThreadExistsInHistoryFromArchivePreference(t *testing.T) {
 		t.Fatal("threadExistsInHistory(thread-missing)=true, want false")
 	}
 }
+
+func TestNormalizeCodexThreadID(t *testing.T) {
+	cases := map[string]string{
+		"11111111-2222-3333-4444-555555555555":             "11111111-2222-3333-4444-555555555555",
+		"  URN:UUID:ABCDEF01-2345-6789-abcd-ef0123456789 ": "abcdef01-2345-6789-abcd-ef0123456789",
+		"":                                      "",
+		"thread-1":                              "",
+		"11111111-2222-3333-4444-55555555555":   "",
+		"11111111-2222-3333-4444-5555555555555": "",
+		"11111111_2222-3333-4444-555555555555":  "",
+		"g1111111-2222-3333-4444-555555555555":  "",
+	}
+	for raw, want := range cases {
+		if got := normalizeCodexThreadID(raw); got != want {
+			t.Errorf("normalizeCodexThreadID(%q) = %q, want %q", raw, got, want)
+		}
+		if got := isLikelyCodexThreadID(raw); got != (want != "") {
+			t.Errorf("isLikelyCodexThreadID(%q) = %v", raw, got)
+		}
+	}
+}
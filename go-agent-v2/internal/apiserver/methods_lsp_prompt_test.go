@@ -70,3 +70,28 @@ func TestConfigLSPPromptHintWrite_TooLong(t *testing.T) {
 		t.Fatal("expected error for overlong hint")
 	}
 }
+
+func TestResolveLSPUsagePromptHint_CachedUntilPreferenceWrite(t *testing.T) {
+	ctx := context.Background()
+	srv := &Server{prefManager: uistate.NewPreferenceManager(nil)}
+
+	if got := srv.resolveLSPUsagePromptHint(ctx); got != defaultLSPUsagePromptHint {
+		t.Fatalf("initial hint = %q, want default", got)
+	}
+
+	// 绕过 Server 直接写偏好: TTL 内仍返回缓存值
+	if err := srv.prefManager.Set(ctx, prefKeyLSPUsagePromptHint, "外部写入"); err != nil {
+		t.Fatalf("set pref: %v", err)
+	}
+	if got := srv.resolveLSPUsagePromptHint(ctx); got != defaultLSPUsagePromptHint {
+		t.Fatalf("hint within TTL = %q, want cached default", got)
+	}
+
+	// 经 ui/preferences/set 写入会立即失效缓存
+	if _, err := srv.uiPreferencesSet(ctx, uiPrefSetParams{Key: prefKeyLSPUsagePromptHint, Value: "界面写入"}); err != nil {
+		t.Fatalf("uiPreferencesSet: %v", err)
+	}
+	if got := srv.resolveLSPUsagePromptHint(ctx); got != "界面写入" {
+		t.Fatalf("hint after ui write = %q, want %q", got, "界面写入")
+	}
+}
@@ -519,11 +519,13 @@ type skillsRemoteReadParams struct {
 	URL string `json:"url"`
 }
 
+// remoteSkillClient 远程 Skill 拉取共用的 HTTP 客户端 (进程级复用, keep-alive 连接跨调用保留)。
+var remoteSkillClient = &http.Client{Timeout: 15 * time.Second}
+
 // skillsRemoteReadTyped 读取远程 Skill。
 func (s *Server) skillsRemoteReadTyped(_ context.Context, p skillsRemoteReadParams) (any, error) {
 	logger.Info("skills/remote/read: fetching", logger.FieldURL, p.URL)
-	client := &http.Client{Timeout: 15 * time.Second}
-	resp, err := client.Get(p.URL)
+	resp, err := remoteSkillClient.Get(p.URL)
 	if err != nil {
 		logger.Warn("skills/remote/read: fetch failed", logger.FieldURL, p.URL, logger.FieldError, err)
 		return nil, apperrors.Wrap(err, "Server.skillsRemoteRead", "fetch remote skill")
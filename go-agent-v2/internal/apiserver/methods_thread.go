@@ -792,6 +792,10 @@ func calculateHydrationLoadLimit(initialCount int, total int64) int {
 	return limit
 }
 
+// parseRolloutTimestamp 解析 rollout 时间戳。
+//
+// time.Parse 对秒后小数位宽松匹配, RFC3339Nano 一次即可覆盖带/不带小数的
+// RFC3339, 无需失败后再按 RFC3339 重解析。
 func parseRolloutTimestamp(raw string) time.Time {
 	value := strings.TrimSpace(raw)
 	if value == "" {
@@ -800,9 +804,6 @@ func parseRolloutTimestamp(raw string) time.Time {
 	if ts, err := time.Parse(time.RFC3339Nano, value); err == nil {
 		return ts
 	}
-	if ts, err := time.Parse(time.RFC3339, value); err == nil {
-		return ts
-	}
 	return time.Time{}
 }
 
@@ -904,12 +905,18 @@ func (s *Server) loadAllThreadMessagesFromCodexRollout(ctx context.Context, thre
 	}
 
 	all := make([]threadHistoryMessage, 0, len(rolloutMsgs))
+	// 同一轮次的相邻消息常共用时间戳: 与上一条相同时直接复用解析结果
+	var lastRawTs string
+	var createdAt time.Time
 	for i, item := range rolloutMsgs {
 		role := strings.ToLower(strings.TrimSpace(item.Role))
 		if role != "user" && role != "assistant" {
 			continue
 		}
-		createdAt := parseRolloutTimestamp(item.Timestamp)
+		if item.Timestamp != lastRawTs {
+			lastRawTs = item.Timestamp
+			createdAt = parseRolloutTimestamp(item.Timestamp)
+		}
 		eventType := ""
 		if role == "assistant" {
 			eventType = codex.EventAgentMessage
@@ -461,3 +461,18 @@ func TestCopyFileOverwriteKeepsTargetWhenSourceMissing(t *testing.T) {
 		t.Fatalf("target should stay unchanged after failed overwrite, got=%q", string(got))
 	}
 }
+
+func TestParseRolloutTimestamp(t *testing.T) {
+	want := time.Date(2026, 2, 1, 10, 20, 30, 0, time.UTC)
+	if got := parseRolloutTimestamp(" 2026-02-01T10:20:30Z "); !got.Equal(want) {
+		t.Fatalf("RFC3339 = %v, want %v", got, want)
+	}
+	if got := parseRolloutTimestamp("2026-02-01T10:20:30.125Z"); !got.Equal(want.Add(125 * time.Millisecond)) {
+		t.Fatalf("RFC3339Nano = %v", got)
+	}
+	for _, raw := range []string{"", "not-a-time", "2026-02-01"} {
+		if got := parseRolloutTimestamp(raw); !got.IsZero() {
+			t.Fatalf("parseRolloutTimestamp(%q) = %v, want zero", raw, got)
+		}
+	}
+}
@@ -131,24 +131,60 @@ func validateLSPUsagePromptHint(hint string) error {
 	return nil
 }
 
+// lspHintCacheTTL LSP 提示词缓存有效期; 本进程内的写入会立即失效缓存,
+// TTL 只兜底其它进程直接改偏好表的情况。
+const lspHintCacheTTL = 30 * time.Second
+
+// resolveLSPUsagePromptHint 返回当前生效的 LSP 提示词 (带 TTL 缓存)。
 func (s *Server) resolveLSPUsagePromptHint(ctx context.Context) string {
 	if s.prefManager == nil {
 		return defaultLSPUsagePromptHint
 	}
+	s.lspHintMu.Lock()
+	if !s.lspHintLoadedAt.IsZero() && time.Since(s.lspHintLoadedAt) < lspHintCacheTTL {
+		hint := s.lspHint
+		s.lspHintMu.Unlock()
+		return hint
+	}
+	gen := s.lspHintGen
+	s.lspHintMu.Unlock()
+
+	hint, ok := s.loadLSPUsagePromptHint(ctx)
+	if ok {
+		s.lspHintMu.Lock()
+		// 加载期间有写入失效过缓存: 读到的可能是旧值, 本次照常返回但不回填
+		if s.lspHintGen == gen {
+			s.lspHint, s.lspHintLoadedAt = hint, time.Now()
+		}
+		s.lspHintMu.Unlock()
+	}
+	return hint
+}
+
+// invalidateLSPUsagePromptHint 偏好写入后丢弃缓存, 下次读取重新加载。
+func (s *Server) invalidateLSPUsagePromptHint() {
+	s.lspHintMu.Lock()
+	s.lspHintLoadedAt = time.Time{}
+	s.lspHintGen++
+	s.lspHintMu.Unlock()
+}
+
+// loadLSPUsagePromptHint 从偏好存储读取提示词; ok=false 表示读取失败 (不缓存)。
+func (s *Server) loadLSPUsagePromptHint(ctx context.Context) (hint string, ok bool) {
 	value, err := s.prefManager.Get(ctx, prefKeyLSPUsagePromptHint)
 	if err != nil {
 		logger.Warn("lsp hint: load preference failed", logger.FieldError, err)
-		return defaultLSPUsagePromptHint
+		return defaultLSPUsagePromptHint, false
 	}
-	hint := strings.TrimSpace(asString(value))
+	hint = strings.TrimSpace(asString(value))
 	if hint == "" {
-		return defaultLSPUsagePromptHint
+		return defaultLSPUsagePromptHint, true
 	}
 	if err := validateLSPUsagePromptHint(hint); err != nil {
 		logger.Warn("lsp hint: invalid preference fallback to default", logger.FieldError, err)
-		return defaultLSPUsagePromptHint
+		return defaultLSPUsagePromptHint, true
 	}
-	return hint
+	return hint, true
 }
 
 func (s *Server) resolveUnifiedToolingPrompt(ctx context.Context) string {
@@ -4,7 +4,10 @@ import (
 	"context"
 	"encoding/json"
 	"strings"
+	"sync"
 	"time"
+
+	"github.com/multi-agent/go-agent-v2/pkg/util"
 )
 
 type uiDashboardGetParams struct {
@@ -53,6 +56,22 @@ func (s *Server) callDash(ctx context.Context, method string) (any, error) {
 	return s.callMethod(ctx, "dashboard/"+method, json.RawMessage(`{}`))
 }
 
+// callDashConcurrent 并发调用多个相互独立的 dashboard 方法, 结果按入参顺序返回。
+// 页面需要多张表时 (tasks/commands), 耗时由各查询之和降为其中最慢者。
+func (s *Server) callDashConcurrent(ctx context.Context, methods ...string) []any {
+	out := make([]any, len(methods))
+	var wg sync.WaitGroup
+	for i, method := range methods {
+		wg.Add(1)
+		util.SafeGo(func() {
+			defer wg.Done()
+			out[i], _ = s.callDash(ctx, method)
+		})
+	}
+	wg.Wait()
+	return out
+}
+
 // buildAgentFallbackFromThreads 从 thread/list 构造 agents 页面兜底数据。
 //
 // 场景: 重启后 dashboard/agentStatus 暂无记录时, 使用线程列表(含历史线程)保证前端 Agent 页不为空。
@@ -122,18 +141,16 @@ func (s *Server) uiDashboardGet(ctx context.Context, p uiDashboardGetParams) (an
 		out, _ := s.callDash(ctx, "dags")
 		copyListField(result, "dags", out, "dags")
 	case "tasks":
-		acks, _ := s.callDash(ctx, "taskAcks")
-		traces, _ := s.callDash(ctx, "taskTraces")
-		copyListField(result, "taskAcks", acks, "acks")
-		copyListField(result, "taskTraces", traces, "traces")
+		outs := s.callDashConcurrent(ctx, "taskAcks", "taskTraces")
+		copyListField(result, "taskAcks", outs[0], "acks")
+		copyListField(result, "taskTraces", outs[1], "traces")
 	case "skills":
 		out, _ := s.callDash(ctx, "skills")
 		copyListField(result, "skills", out, "skills")
 	case "commands":
-		cards, _ := s.callDash(ctx, "commandCards")
-		prompts, _ := s.callDash(ctx, "prompts")
-		copyListField(result, "commandCards", cards, "cards")
-		copyListField(result, "prompts", prompts, "prompts")
+		outs := s.callDashConcurrent(ctx, "commandCards", "prompts")
+		copyListField(result, "commandCards", outs[0], "cards")
+		copyListField(result, "prompts", outs[1], "prompts")
 	case "memory":
 		out, _ := s.callDash(ctx, "sharedFiles")
 		copyListField(result, "memory", out, "files")
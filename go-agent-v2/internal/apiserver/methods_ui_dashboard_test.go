@@ -86,3 +86,28 @@ func TestUIDashboardGetAgentsFallsBackToThreads(t *testing.T) {
 		t.Fatal("updated_at is missing")
 	}
 }
+
+func TestUIDashboardGetTasksFetchesBothLists(t *testing.T) {
+	srv := &Server{
+		methods: map[string]Handler{
+			"dashboard/taskAcks": func(_ context.Context, _ json.RawMessage) (any, error) {
+				return map[string]any{"acks": []any{"ack-1"}}, nil
+			},
+			"dashboard/taskTraces": func(_ context.Context, _ json.RawMessage) (any, error) {
+				return map[string]any{"traces": []any{"trace-1", "trace-2"}}, nil
+			},
+		},
+	}
+
+	raw, err := srv.uiDashboardGet(context.Background(), uiDashboardGetParams{Page: "tasks"})
+	if err != nil {
+		t.Fatalf("uiDashboardGet error: %v", err)
+	}
+	resp := raw.(map[string]any)
+	if acks := resp["taskAcks"].([]any); len(acks) != 1 || acks[0] != "ack-1" {
+		t.Fatalf("taskAcks=%v, want [ack-1]", acks)
+	}
+	if traces := resp["taskTraces"].([]any); len(traces) != 2 {
+		t.Fatalf("taskTraces=%v, want 2 items", traces)
+	}
+}
@@ -43,6 +43,8 @@ func (s *Server) uiPreferencesSet(ctx context.Context, p uiPrefSetParams) (any,
 	}
 	// stall 参数运行时热调
 	switch p.Key {
+	case prefKeyLSPUsagePromptHint:
+		s.invalidateLSPUsagePromptHint()
 	case "stallThresholdSec":
 		if sec := asPositiveInt(p.Value, 30); sec > 0 {
 			s.stallThreshold = time.Duration(sec) * time.Second
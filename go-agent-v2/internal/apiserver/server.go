@@ -148,6 +148,12 @@ type Server struct {
 	orchestrationPendingReports map[string]map[string]time.Time
 	orchestrationReportTTL      time.Duration
 
+	// LSP 使用提示词缓存 (每次 turn 提交都会拼接, 避免每轮读一次偏好存储)
+	lspHintMu       sync.Mutex
+	lspHint         string
+	lspHintLoadedAt time.Time
+	lspHintGen      uint64 // 每次失效 +1; 加载期间发生失效则丢弃加载结果
+
 	// Per-session 技能配置 (agentID → skills 列表)
 	skillsMu    sync.RWMutex
 	agentSkills map[string][]string // agentID → ["skill1", "skill2"]
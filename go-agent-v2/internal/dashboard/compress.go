@@ -0,0 +1,184 @@
+// compress.go — 大列表接口与静态资源的 gzip 响应压缩。
+package dashboard
+
+import (
+	"compress/gzip"
+	"io"
+	"net/http"
+	"path"
+	"strings"
+	"sync"
+
+	"github.com/gin-gonic/gin"
+)
+
+// gzipMinSize 响应体达到该字节数才压缩: 更小的响应 (okBody、错误信封等)
+// 压缩收益抵不过 gzip 头尾与 CPU 开销, 原样返回。
+const gzipMinSize = 1024
+
+// gzipWriterPool 复用 gzip.Writer (每个实例自带数百 KB 压缩窗口, 不宜每请求新建)。
+var gzipWriterPool = sync.Pool{
+	New: func() any {
+		zw, _ := gzip.NewWriterLevel(io.Discard, gzip.BestSpeed)
+		return zw
+	},
+}
+
+// gzipResponseWriter 将响应体写入 gzip 流, 其余行为委托给 gin.ResponseWriter。
+//
+// 响应体先暂存, 累计达到 gzipMinSize (或遇到 Flush) 时按最终状态码与响应头决定一次
+// 是否压缩; 请求结束仍未达到阈值则原样写出。非 2xx、204, 或 handler 移除了
+// Content-Encoding (如 http.ServeFile 出错时) 均原样写出; gzip.Writer 仅在
+// 真正开始压缩时才取用, 无响应体时不写 gzip 头尾。
+type gzipResponseWriter struct {
+	gin.ResponseWriter
+	status  int
+	decided bool
+	zw      *gzip.Writer // 非 nil 表示已启用压缩
+	buf     []byte       // 决定前暂存的响应体
+}
+
+// WriteHeader 仅记录状态码, 写出推迟到决定是否压缩之后。
+func (w *gzipResponseWriter) WriteHeader(code int) {
+	if w.decided {
+		w.ResponseWriter.WriteHeader(code)
+		return
+	}
+	w.status = code
+}
+
+// WriteHeaderNow gin 对无响应体状态 (204/304, AbortWithStatus) 直接写头, 此时按不压缩处理。
+func (w *gzipResponseWriter) WriteHeaderNow() {
+	_ = w.decide(false)
+	w.ResponseWriter.WriteHeaderNow()
+}
+
+// Status 决定前返回已记录的状态码。
+func (w *gzipResponseWriter) Status() int {
+	if w.decided {
+		return w.ResponseWriter.Status()
+	}
+	return w.status
+}
+
+func (w *gzipResponseWriter) Write(b []byte) (int, error) {
+	if !w.decided {
+		if len(w.buf)+len(b) < gzipMinSize {
+			w.buf = append(w.buf, b...)
+			return len(b), nil
+		}
+		if err := w.decide(true); err != nil {
+			return 0, err
+		}
+	}
+	if w.zw != nil {
+		return w.zw.Write(b)
+	}
+	return w.ResponseWriter.Write(b)
+}
+
+func (w *gzipResponseWriter) WriteString(s string) (int, error) { return w.Write([]byte(s)) }
+
+// Flush 先冲刷 gzip 缓冲, 再冲刷底层连接。
+// 流式响应 (SSE) 总长未知, 首次 Flush 即按可压缩处理, 不等阈值。
+func (w *gzipResponseWriter) Flush() {
+	_ = w.decide(true)
+	if w.zw != nil {
+		_ = w.zw.Flush()
+	}
+	w.ResponseWriter.Flush()
+}
+
+// decide 首次调用时确定是否压缩, 把状态码交给底层 writer 并写出暂存内容;
+// large 表示响应体已达到阈值 (或为流式响应)。
+func (w *gzipResponseWriter) decide(large bool) error {
+	if w.decided {
+		return nil
+	}
+	w.decided = true
+	h := w.Header()
+	if h.Get("Content-Encoding") == "gzip" {
+		if large && compressibleStatus(w.status) {
+			// 压缩后长度未知, 删除 handler 可能设置的 Content-Length
+			h.Del("Content-Length")
+			w.zw = gzipWriterPool.Get().(*gzip.Writer)
+			w.zw.Reset(w.ResponseWriter)
+		} else {
+			h.Del("Content-Encoding")
+		}
+	}
+	w.ResponseWriter.WriteHeader(w.status)
+	if len(w.buf) == 0 {
+		return nil
+	}
+	buf := w.buf
+	w.buf = nil
+	var err error
+	if w.zw != nil {
+		_, err = w.zw.Write(buf)
+	} else {
+		_, err = w.ResponseWriter.Write(buf)
+	}
+	return err
+}
+
+// finish 请求结束: 未达阈值的内容原样写出; 已压缩则写出 gzip 尾部并归还 writer。
+func (w *gzipResponseWriter) finish() {
+	_ = w.decide(false)
+	if w.zw == nil {
+		return
+	}
+	_ = w.zw.Close()
+	w.zw.Reset(io.Discard)
+	gzipWriterPool.Put(w.zw)
+	w.zw = nil
+}
+
+// compressibleStatus 只压缩带响应体的成功状态 (204/304 无响应体, 错误页原样返回)。
+func compressibleStatus(code int) bool {
+	return code >= http.StatusOK && code < http.StatusMultipleChoices && code != http.StatusNoContent
+}
+
+// gzipResponse 客户端声明 Accept-Encoding: gzip 时压缩响应体。
+//
+// 挂在返回数百~数千行 JSON 的列表路由上: 这类响应键名高度重复, BestSpeed
+// 即可压缩到约 1/8, CPU 开销远小于节省的传输时间。
+// SSE 路由同样适用: c.Stream 每步调用 Flush, 会以 sync flush 立即送出已压缩的帧。
+func gzipResponse() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		if !strings.Contains(c.GetHeader("Accept-Encoding"), "gzip") {
+			c.Next()
+			return
+		}
+		c.Header("Content-Encoding", "gzip")
+		c.Header("Vary", "Accept-Encoding")
+		gw := &gzipResponseWriter{ResponseWriter: c.Writer, status: http.StatusOK}
+		c.Writer = gw
+		defer gw.finish()
+		c.Next()
+	}
+}
+
+// compressibleExts 值得压缩的文本类静态资源; 图片/字体等已压缩格式原样返回。
+var compressibleExts = map[string]bool{
+	".html": true, ".js": true, ".mjs": true, ".css": true,
+	".json": true, ".svg": true, ".map": true, ".txt": true,
+}
+
+// gzipStatic 面板外壳 (/) 与 /static 下的文本资源启用 gzip。
+//
+// 压缩时丢弃 Range 头: 分段偏移针对原始字节, 与压缩流对不上, 直接整体返回。
+func gzipStatic() gin.HandlerFunc {
+	gz := gzipResponse()
+	return func(c *gin.Context) {
+		p := c.Request.URL.Path
+		if !strings.HasSuffix(p, "/") && !compressibleExts[strings.ToLower(path.Ext(p))] {
+			c.Next()
+			return
+		}
+		if strings.Contains(c.GetHeader("Accept-Encoding"), "gzip") {
+			c.Request.Header.Del("Range")
+		}
+		gz(c)
+	}
+}
@@ -0,0 +1,162 @@
+package dashboard
+
+import (
+	"bytes"
+	"compress/gzip"
+	"encoding/json"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"strings"
+	"testing"
+
+	"github.com/gin-gonic/gin"
+)
+
+func TestGzipResponse(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+	r := gin.New()
+	rows := make([]gin.H, 100)
+	for i := range rows {
+		rows[i] = gin.H{"level": "info", "message": "hello"}
+	}
+	r.GET("/rows", gzipResponse(), func(c *gin.Context) { success(c, rows) })
+	r.POST("/ok", gzipResponse(), successOK)
+
+	// 未声明 gzip: 原样返回
+	w := httptest.NewRecorder()
+	r.ServeHTTP(w, httptest.NewRequest(http.MethodGet, "/rows", nil))
+	if enc := w.Header().Get("Content-Encoding"); enc != "" {
+		t.Fatalf("Content-Encoding = %q, want empty", enc)
+	}
+	if !json.Valid(w.Body.Bytes()) {
+		t.Fatalf("plain body is not JSON: %q", w.Body.String())
+	}
+
+	// 声明 gzip: 解压后与原响应一致
+	req := httptest.NewRequest(http.MethodGet, "/rows", nil)
+	req.Header.Set("Accept-Encoding", "gzip, deflate")
+	gw := httptest.NewRecorder()
+	r.ServeHTTP(gw, req)
+	if enc := gw.Header().Get("Content-Encoding"); enc != "gzip" {
+		t.Fatalf("Content-Encoding = %q, want gzip", enc)
+	}
+	zr, err := gzip.NewReader(gw.Body)
+	if err != nil {
+		t.Fatalf("gzip.NewReader: %v", err)
+	}
+	body, err := io.ReadAll(zr)
+	if err != nil {
+		t.Fatalf("read gzip body: %v", err)
+	}
+	if string(body) != w.Body.String() {
+		t.Fatalf("decompressed body = %q, want %q", body, w.Body.String())
+	}
+
+	// 小于 gzipMinSize: 即使声明 gzip 也原样返回
+	req = httptest.NewRequest(http.MethodPost, "/ok", nil)
+	req.Header.Set("Accept-Encoding", "gzip")
+	sw := httptest.NewRecorder()
+	r.ServeHTTP(sw, req)
+	if enc := sw.Header().Get("Content-Encoding"); enc != "" {
+		t.Fatalf("small body Content-Encoding = %q, want empty", enc)
+	}
+	if !bytes.Equal(sw.Body.Bytes(), okBody) {
+		t.Fatalf("small body = %q, want %q", sw.Body.Bytes(), okBody)
+	}
+}
+
+// TestGzipResponse_FlushEmitsFrame Flush 后已写入的数据可被立即解压读出 (SSE 依赖此行为)。
+func TestGzipResponse_FlushEmitsFrame(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+	r := gin.New()
+	frame := "event:ping\ndata:keepalive\n\n"
+	var flushed int
+	r.GET("/events", gzipResponse(), func(c *gin.Context) {
+		_, _ = c.Writer.WriteString(frame)
+		c.Writer.Flush()
+		flushed = c.Writer.Size()
+	})
+
+	req := httptest.NewRequest(http.MethodGet, "/events", nil)
+	req.Header.Set("Accept-Encoding", "gzip")
+	w := httptest.NewRecorder()
+	r.ServeHTTP(w, req)
+
+	// 只取 Flush 时已送出的字节 (不含 Close 写入的 trailer)
+	zr, err := gzip.NewReader(bytes.NewReader(w.Body.Bytes()[:flushed]))
+	if err != nil {
+		t.Fatalf("gzip.NewReader: %v", err)
+	}
+	got := make([]byte, len(frame))
+	if _, err := io.ReadFull(zr, got); err != nil {
+		t.Fatalf("read flushed frame: %v", err)
+	}
+	if string(got) != frame {
+		t.Fatalf("flushed frame = %q, want %q", got, frame)
+	}
+}
+
+func TestGzipStatic_OnlyTextAssets(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+	r := gin.New()
+	var gotRange string
+	serve := func(c *gin.Context) {
+		gotRange = c.GetHeader("Range")
+		_, _ = c.Writer.WriteString("<html>" + strings.Repeat("<p>row</p>", gzipMinSize/10) + "</html>")
+	}
+	web := r.Group("", gzipStatic())
+	web.GET("/", serve)
+	web.GET("/static/*filepath", serve)
+
+	cases := map[string]string{
+		"/":                  "gzip",
+		"/static/app.js":     "gzip",
+		"/static/STYLE.CSS":  "gzip",
+		"/static/banner.png": "",
+		"/static/font.woff2": "",
+	}
+	for target, wantEnc := range cases {
+		req := httptest.NewRequest(http.MethodGet, target, nil)
+		req.Header.Set("Accept-Encoding", "gzip")
+		req.Header.Set("Range", "bytes=0-3")
+		w := httptest.NewRecorder()
+		r.ServeHTTP(w, req)
+		if enc := w.Header().Get("Content-Encoding"); enc != wantEnc {
+			t.Errorf("%s: Content-Encoding = %q, want %q", target, enc, wantEnc)
+		}
+		if wantRange := wantEnc == ""; (gotRange != "") != wantRange {
+			t.Errorf("%s: Range header = %q after middleware", target, gotRange)
+		}
+	}
+}
+
+// TestGzipStatic_ErrorAndBodilessPassThrough 错误页与无响应体状态不压缩, 也不带 Content-Encoding。
+func TestGzipStatic_ErrorAndBodilessPassThrough(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+	s := &Server{router: gin.New()}
+	s.registerRoutes() // 测试目录下无 ./static/index.html, / 走 http.ServeFile 的 404
+	s.router.GET("/not-modified", gzipStatic(), func(c *gin.Context) { c.Status(http.StatusNotModified) })
+
+	req := httptest.NewRequest(http.MethodGet, "/", nil)
+	req.Header.Set("Accept-Encoding", "gzip")
+	w := httptest.NewRecorder()
+	s.router.ServeHTTP(w, req)
+	if w.Code != http.StatusNotFound {
+		t.Fatalf("/: code = %d, want 404", w.Code)
+	}
+	if enc := w.Header().Get("Content-Encoding"); enc != "" {
+		t.Fatalf("/: Content-Encoding = %q, want empty", enc)
+	}
+	if !strings.Contains(w.Body.String(), "404 page not found") {
+		t.Fatalf("/: body = %q, want plain 404 text", w.Body.String())
+	}
+
+	req = httptest.NewRequest(http.MethodGet, "/not-modified", nil)
+	req.Header.Set("Accept-Encoding", "gzip")
+	w = httptest.NewRecorder()
+	s.router.ServeHTTP(w, req)
+	if w.Code != http.StatusNotModified || w.Body.Len() != 0 || w.Header().Get("Content-Encoding") != "" {
+		t.Fatalf("304: code=%d body=%q encoding=%q", w.Code, w.Body.String(), w.Header().Get("Content-Encoding"))
+	}
+}
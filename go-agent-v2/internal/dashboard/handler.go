@@ -2,8 +2,12 @@
 package dashboard
 
 import (
+	"encoding/json"
+	"errors"
+	"io"
 	"net/http"
 	"strconv"
+	"strings"
 
 	"github.com/gin-gonic/gin"
 
@@ -14,11 +18,12 @@ import (
 // registerRoutes 注册 API 路由 (对应 Python dashboard.py do_GET/do_POST)。
 func (s *Server) registerRoutes() {
 	api := s.router.Group("/api")
+	gz := gzipResponse()
 
 	api.GET("/interactions", s.listInteractions)
 	api.POST("/interactions", s.createInteraction)
 
-	api.GET("/task-traces", s.listTaskTraces)
+	api.GET("/task-traces", gz, s.listTaskTraces)
 
 	api.GET("/prompt-templates", s.listPromptTemplates)
 	api.POST("/prompt-templates", s.savePromptTemplate)
@@ -29,10 +34,10 @@ func (s *Server) registerRoutes() {
 	api.POST("/command-cards", s.saveCommandCard)
 	api.DELETE("/command-cards/:key", s.deleteCommandCard)
 
-	api.GET("/audit-log", s.listAuditLog)
-	api.GET("/system-log", s.listSystemLog)
-	api.GET("/ai-log", s.listAILog)
-	api.GET("/bus-log", s.listBusLog)
+	api.GET("/audit-log", gz, s.listAuditLog)
+	api.GET("/system-log", gz, s.listSystemLog)
+	api.GET("/ai-log", gz, s.listAILog)
+	api.GET("/bus-log", gz, s.listBusLog)
 
 	api.GET("/agent-status", s.listAgentStatus)
 
@@ -46,18 +51,27 @@ func (s *Server) registerRoutes() {
 
 	api.POST("/db-query", s.dbQuery)
 
-	api.GET("/events", s.sseHandler)
+	api.GET("/events", gz, s.sseHandler)
 
-	s.router.Static("/static", "./static")
-	s.router.GET("/", func(c *gin.Context) { c.File("./static/index.html") })
+	web := s.router.Group("", gzipStatic())
+	web.Static("/static", "./static")
+	web.GET("/", func(c *gin.Context) { c.File("./static/index.html") })
 }
 
 // ========================================
 // 辅助: 从 query 读分页参数 (DRY)
 // ========================================
 
+// queryLimit 读取 limit 参数。
+//
+// gin 的 c.Query 已按请求缓存解析结果; 缺省时直接返回 def,
+// 不再把默认值格式化成字符串再解析回来。
 func queryLimit(c *gin.Context, def int) int {
-	v, _ := strconv.Atoi(c.DefaultQuery("limit", strconv.Itoa(def)))
+	raw, ok := c.GetQuery("limit")
+	if !ok {
+		return def
+	}
+	v, _ := strconv.Atoi(raw)
 	if v < 1 {
 		return def
 	}
@@ -89,8 +103,11 @@ func (s *Server) createInteraction(c *gin.Context) {
 		MsgType  string `json:"msg_type"`
 		Payload  any    `json:"payload"`
 	}
-	if err := c.ShouldBindJSON(&req); err != nil {
-		badRequest(c, "invalid_request", err.Error())
+	if !bindJSON(c, &req) {
+		return
+	}
+	if strings.TrimSpace(req.Sender) == "" || strings.TrimSpace(req.MsgType) == "" {
+		badRequest(c, "invalid_request", "sender 与 msg_type 不能为空")
 		return
 	}
 	item, err := s.stores.Interaction.Create(c.Request.Context(), &store.Interaction{
@@ -101,6 +118,7 @@ func (s *Server) createInteraction(c *gin.Context) {
 		serverError(c, err)
 		return
 	}
+	s.notifySync("interactions")
 	created(c, item)
 }
 
@@ -134,8 +152,12 @@ func (s *Server) listPromptTemplates(c *gin.Context) {
 
 func (s *Server) savePromptTemplate(c *gin.Context) {
 	var req store.PromptTemplate
-	if err := c.ShouldBindJSON(&req); err != nil {
-		badRequest(c, "invalid_request", err.Error())
+	if !bindJSON(c, &req) {
+		return
+	}
+	req.PromptKey = strings.TrimSpace(req.PromptKey)
+	if req.PromptKey == "" {
+		badRequest(c, "invalid_request", "prompt_key 不能为空")
 		return
 	}
 	item, err := s.stores.PromptTemplate.Save(c.Request.Context(), &req)
@@ -143,6 +165,7 @@ func (s *Server) savePromptTemplate(c *gin.Context) {
 		serverError(c, err)
 		return
 	}
+	s.notifySync("prompt_templates")
 	success(c, item)
 }
 
@@ -152,15 +175,20 @@ func (s *Server) togglePromptTemplate(c *gin.Context) {
 		Enabled   bool   `json:"enabled"`
 		UpdatedBy string `json:"updated_by"`
 	}
-	if err := c.ShouldBindJSON(&req); err != nil {
-		badRequest(c, "invalid_request", err.Error())
+	if !bindJSON(c, &req) {
+		return
+	}
+	req.PromptKey = strings.TrimSpace(req.PromptKey)
+	if req.PromptKey == "" {
+		badRequest(c, "invalid_request", "prompt_key 不能为空")
 		return
 	}
 	if err := s.stores.PromptTemplate.SetEnabled(c.Request.Context(), req.PromptKey, req.Enabled, req.UpdatedBy); err != nil {
 		serverError(c, err)
 		return
 	}
-	success(c, gin.H{"ok": true})
+	s.notifySync("prompt_templates")
+	successOK(c)
 }
 
 func (s *Server) deletePromptTemplate(c *gin.Context) {
@@ -168,7 +196,8 @@ func (s *Server) deletePromptTemplate(c *gin.Context) {
 		serverError(c, err)
 		return
 	}
-	success(c, gin.H{"ok": true})
+	s.notifySync("prompt_templates")
+	successOK(c)
 }
 
 // ========================================
@@ -186,8 +215,12 @@ func (s *Server) listCommandCards(c *gin.Context) {
 
 func (s *Server) saveCommandCard(c *gin.Context) {
 	var req store.CommandCard
-	if err := c.ShouldBindJSON(&req); err != nil {
-		badRequest(c, "invalid_request", err.Error())
+	if !bindJSON(c, &req) {
+		return
+	}
+	req.CardKey = strings.TrimSpace(req.CardKey)
+	if req.CardKey == "" {
+		badRequest(c, "invalid_request", "card_key 不能为空")
 		return
 	}
 	item, err := s.stores.CommandCard.Save(c.Request.Context(), &req)
@@ -195,6 +228,7 @@ func (s *Server) saveCommandCard(c *gin.Context) {
 		serverError(c, err)
 		return
 	}
+	s.notifySync("command_cards")
 	success(c, item)
 }
 
@@ -203,7 +237,8 @@ func (s *Server) deleteCommandCard(c *gin.Context) {
 		serverError(c, err)
 		return
 	}
-	success(c, gin.H{"ok": true})
+	s.notifySync("command_cards")
+	successOK(c)
 }
 
 // ========================================
@@ -292,8 +327,11 @@ func (s *Server) writeSharedFile(c *gin.Context) {
 		Content string `json:"content"`
 		Actor   string `json:"actor"`
 	}
-	if err := c.ShouldBindJSON(&req); err != nil {
-		badRequest(c, "invalid_request", err.Error())
+	if !bindJSON(c, &req) {
+		return
+	}
+	if strings.Trim(strings.TrimSpace(req.Path), "/") == "" {
+		badRequest(c, "invalid_request", "path 不能为空")
 		return
 	}
 	item, err := s.stores.SharedFile.Write(c.Request.Context(), req.Path, req.Content, req.Actor)
@@ -301,6 +339,7 @@ func (s *Server) writeSharedFile(c *gin.Context) {
 		serverError(c, err)
 		return
 	}
+	s.notifySync("shared_files")
 	success(c, item)
 }
 
@@ -310,6 +349,7 @@ func (s *Server) deleteSharedFile(c *gin.Context) {
 		serverError(c, err)
 		return
 	}
+	s.notifySync("shared_files")
 	success(c, gin.H{"deleted": deleted})
 }
 
@@ -331,15 +371,19 @@ func (s *Server) approveTopology(c *gin.Context) {
 		ID         int    `json:"id"`
 		ApprovedBy string `json:"approved_by"`
 	}
-	if err := c.ShouldBindJSON(&req); err != nil {
-		badRequest(c, "invalid_request", err.Error())
+	if !bindJSON(c, &req) {
+		return
+	}
+	if req.ID <= 0 {
+		badRequest(c, "invalid_request", "id 必须为正整数")
 		return
 	}
 	if err := s.stores.TopologyApproval.Approve(c.Request.Context(), req.ID, req.ApprovedBy); err != nil {
 		serverError(c, err)
 		return
 	}
-	success(c, gin.H{"ok": true})
+	s.notifySync("approvals")
+	successOK(c)
 }
 
 func (s *Server) rejectTopology(c *gin.Context) {
@@ -347,15 +391,19 @@ func (s *Server) rejectTopology(c *gin.Context) {
 		ID         int    `json:"id"`
 		RejectedBy string `json:"rejected_by"`
 	}
-	if err := c.ShouldBindJSON(&req); err != nil {
-		badRequest(c, "invalid_request", err.Error())
+	if !bindJSON(c, &req) {
+		return
+	}
+	if req.ID <= 0 {
+		badRequest(c, "invalid_request", "id 必须为正整数")
 		return
 	}
 	if err := s.stores.TopologyApproval.Reject(c.Request.Context(), req.ID, req.RejectedBy); err != nil {
 		serverError(c, err)
 		return
 	}
-	success(c, gin.H{"ok": true})
+	s.notifySync("approvals")
+	successOK(c)
 }
 
 // ========================================
@@ -367,8 +415,7 @@ func (s *Server) dbQuery(c *gin.Context) {
 		SQL   string `json:"sql"`
 		Limit int    `json:"limit"`
 	}
-	if err := c.ShouldBindJSON(&req); err != nil {
-		badRequest(c, "invalid_request", err.Error())
+	if !bindJSON(c, &req) {
 		return
 	}
 	rows, err := s.stores.DBQuery.Query(c.Request.Context(), req.SQL, req.Limit)
@@ -383,10 +430,52 @@ func (s *Server) dbQuery(c *gin.Context) {
 // 统一响应辅助 (原 response.go, DRY: 所有 handler 共用)
 // ========================================
 
+// notifySync 写操作成功后异步推送 sync 事件 (对应 Python _publish_dashboard_event("sync", ...)),
+// 由 EventBus 后台 goroutine 扇出, 不阻塞当前请求; scope 同时作为路由主题。
+func (s *Server) notifySync(scope ...string) {
+	s.bus.PublishAsync(Event{Type: "sync", Data: gin.H{"scope": scope}, Topics: scope})
+}
+
+// jsonContentType 与 gin c.JSON 写出的 Content-Type 一致。
+const jsonContentType = "application/json; charset=utf-8"
+
+// okBody 预编码的 {"ok": true} 成功响应 (toggle/delete/approve 等写操作共用)。
+var okBody = []byte(`{"success":true,"data":{"ok":true}}`)
+
+// internalErrorBody 预编码的 500 响应 (内容固定, 不回显内部错误)。
+var internalErrorBody = []byte(`{"success":false,"error":{"code":"internal_error","message":"服务器内部错误"}}`)
+
+// errEmptyBody 请求体为空 (与 ShouldBindJSON 一致按 400 拒绝)。
+const errEmptyBody = "请求体不能为空"
+
+// bindJSON 解码请求体到 obj, 失败时写出 400 并返回 false (所有写接口共用)。
+// 请求结构体无 binding 标签, 直接用 json.Decoder 解码, 跳过 ShouldBindJSON 的校验器反射;
+// 空请求体 (含 chunked 空流) 与 ShouldBindJSON 一样返回 400。
+func bindJSON(c *gin.Context, obj any) bool {
+	if c.Request.Body == nil || c.Request.ContentLength == 0 {
+		badRequest(c, "invalid_request", errEmptyBody)
+		return false
+	}
+	if err := json.NewDecoder(c.Request.Body).Decode(obj); err != nil {
+		msg := err.Error()
+		if errors.Is(err, io.EOF) {
+			msg = errEmptyBody
+		}
+		badRequest(c, "invalid_request", msg)
+		return false
+	}
+	return true
+}
+
 func success(c *gin.Context, data any) {
 	c.JSON(http.StatusOK, gin.H{"success": true, "data": data})
 }
 
+// successOK 直接写出 okBody, 省去每次构造 gin.H 与 JSON 序列化。
+func successOK(c *gin.Context) {
+	c.Data(http.StatusOK, jsonContentType, okBody)
+}
+
 func created(c *gin.Context, data any) {
 	c.JSON(http.StatusCreated, gin.H{"success": true, "data": data})
 }
@@ -397,5 +486,5 @@ func badRequest(c *gin.Context, code, message string) {
 
 func serverError(c *gin.Context, err error) {
 	logger.FromContext(c.Request.Context()).Error("internal error", logger.FieldError, err)
-	c.JSON(http.StatusInternalServerError, gin.H{"success": false, "error": gin.H{"code": "internal_error", "message": "服务器内部错误"}})
+	c.Data(http.StatusInternalServerError, jsonContentType, internalErrorBody)
 }
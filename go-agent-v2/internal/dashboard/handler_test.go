@@ -0,0 +1,104 @@
+package dashboard
+
+import (
+	"encoding/json"
+	"net/http"
+	"net/http/httptest"
+	"reflect"
+	"strings"
+	"testing"
+
+	"github.com/gin-gonic/gin"
+)
+
+// TestPrecomputedBodies_MatchJSONEnvelope 预编码响应体必须与 c.JSON 产出的信封结构一致。
+func TestPrecomputedBodies_MatchJSONEnvelope(t *testing.T) {
+	cases := []struct {
+		name string
+		body []byte
+		want map[string]any
+	}{
+		{
+			name: "okBody",
+			body: okBody,
+			want: map[string]any{"success": true, "data": map[string]any{"ok": true}},
+		},
+		{
+			name: "internalErrorBody",
+			body: internalErrorBody,
+			want: map[string]any{"success": false, "error": map[string]any{"code": "internal_error", "message": "服务器内部错误"}},
+		},
+	}
+	for _, tc := range cases {
+		var got map[string]any
+		if err := json.Unmarshal(tc.body, &got); err != nil {
+			t.Fatalf("%s: invalid JSON: %v", tc.name, err)
+		}
+		if !reflect.DeepEqual(got, tc.want) {
+			t.Fatalf("%s = %v, want %v", tc.name, got, tc.want)
+		}
+	}
+}
+
+// TestBindJSON 空请求体 (含 chunked 空流) 与非法 JSON 均返回 400。
+func TestBindJSON(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+	type payload struct {
+		Key string `json:"key"`
+	}
+	cases := []struct {
+		name     string
+		body     string
+		chunked  bool
+		wantOK   bool
+		wantKey  string
+		wantCode int
+	}{
+		{name: "valid", body: `{"key":"k1"}`, wantOK: true, wantKey: "k1", wantCode: http.StatusOK},
+		{name: "empty", body: "", wantOK: false, wantCode: http.StatusBadRequest},
+		{name: "chunked empty", body: "", chunked: true, wantOK: false, wantCode: http.StatusBadRequest},
+		{name: "invalid", body: `{"key":`, wantOK: false, wantCode: http.StatusBadRequest},
+	}
+	for _, tc := range cases {
+		w := httptest.NewRecorder()
+		c, _ := gin.CreateTestContext(w)
+		c.Request = httptest.NewRequest(http.MethodPost, "/api/x", strings.NewReader(tc.body))
+		if tc.chunked {
+			c.Request.ContentLength = -1
+		}
+		var req payload
+		ok := bindJSON(c, &req)
+		if ok != tc.wantOK || req.Key != tc.wantKey || w.Code != tc.wantCode {
+			t.Fatalf("%s: ok=%v key=%q code=%d, want ok=%v key=%q code=%d",
+				tc.name, ok, req.Key, w.Code, tc.wantOK, tc.wantKey, tc.wantCode)
+		}
+	}
+}
+
+// TestWriteHandlers_RejectMissingFields 缺少必填字段时在访问 store 之前返回 400。
+func TestWriteHandlers_RejectMissingFields(t *testing.T) {
+	gin.SetMode(gin.TestMode)
+	s := &Server{router: gin.New()} // stores 为 nil: 若校验漏过会直接 panic
+	s.router.POST("/api/interactions", s.createInteraction)
+	s.router.POST("/api/shared-files", s.writeSharedFile)
+
+	cases := []struct {
+		target string
+		body   string
+	}{
+		{"/api/interactions", ""},
+		{"/api/interactions", `{}`},
+		{"/api/interactions", `{"sender":"a1"}`},
+		{"/api/interactions", `{"sender":" ","msg_type":"note"}`},
+		{"/api/shared-files", ""},
+		{"/api/shared-files", `{"content":"x"}`},
+		{"/api/shared-files", `{"path":" / "}`},
+	}
+	for _, tc := range cases {
+		w := httptest.NewRecorder()
+		s.router.ServeHTTP(w, httptest.NewRequest(http.MethodPost, tc.target, strings.NewReader(tc.body)))
+		if w.Code != http.StatusBadRequest {
+			t.Errorf("POST %s %q: code = %d, want 400", tc.target, tc.body, w.Code)
+		}
+	}
+}
@@ -16,9 +16,10 @@ import (
 
 // Server Dashboard HTTP 服务。
 type Server struct {
-	router *gin.Engine
-	stores *Stores
-	bus    *EventBus
+	router    *gin.Engine
+	stores    *Stores
+	bus       *EventBus
+	keepalive time.Duration // SSE 心跳间隔, 启动时由 DASHBOARD_SSE_SYNC_SEC 解析一次
 }
 
 // Stores 聚合所有 store 依赖 (DRY: 一次注入)。
@@ -57,17 +58,27 @@ func NewServer(stores *Stores, cfg *config.Config) *Server {
 		logger.Warn("dashboard: set trusted proxies failed", logger.FieldError, err)
 	}
 
-	s := &Server{router: r, stores: stores, bus: NewEventBus()}
+	s := &Server{router: r, stores: stores, bus: NewEventBus(), keepalive: sseKeepalive(cfg.DashboardSSESyncSec)}
 	s.registerRoutes()
 	return s
 }
 
+// sseKeepalive 将 DASHBOARD_SSE_SYNC_SEC 限制在 1~60 秒 (对应 Python _safe_int(..., 5, 1, 60))。
+func sseKeepalive(sec int) time.Duration {
+	sec = max(1, min(sec, 60))
+	return time.Duration(sec) * time.Second
+}
+
 // Engine 返回 Gin 引擎。
 func (s *Server) Engine() *gin.Engine { return s.router }
 
 // Bus 返回事件总线。
 func (s *Server) Bus() *EventBus { return s.bus }
 
+// idleConnTimeout keep-alive 空闲连接保留时长: 覆盖面板数秒一次的轮询间隔,
+// 让轮询复用同一 TCP 连接, 同时回收已离开的客户端。
+const idleConnTimeout = 120 * time.Second
+
 // ListenAndServe 启动 HTTP 服务并支持优雅退出。
 //
 // ctx 取消后等待 5 秒完成活跃请求再关闭。
@@ -76,11 +87,13 @@ func (s *Server) ListenAndServe(ctx context.Context, addr string) error {
 		Addr:              addr,
 		Handler:           s.router,
 		ReadHeaderTimeout: 10 * time.Second,
+		IdleTimeout:       idleConnTimeout,
 	}
 
-	// 优雅关闭: 给活跃请求 5 秒完成处理
+	// 优雅关闭: 给活跃请求 5 秒完成处理, 随后停止事件总线
 	go func() {
 		<-ctx.Done()
+		defer s.bus.Close()
 		logger.Info("dashboard: shutdown trigger")
 		shutdownCtx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
 		defer cancel()
@@ -2,56 +2,200 @@
 package dashboard
 
 import (
+	"encoding/json"
 	"fmt"
 	"io"
+	"strings"
 	"sync"
 	"time"
 
 	"github.com/gin-gonic/gin"
 	"github.com/multi-agent/go-agent-v2/pkg/logger"
+	"github.com/multi-agent/go-agent-v2/pkg/util"
 )
 
+// keepaliveFrame 预编码的心跳帧 (内容固定, 每个连接每个心跳间隔写一次, 无需重复序列化)。
+var keepaliveFrame = []byte("event:ping\ndata:keepalive\n\n")
+
+// asyncQueueSize PublishAsync 的有界队列容量; 队列满时丢弃事件 (SSE 推送为尽力而为)。
+const asyncQueueSize = 1024
+
 // EventBus 事件总线 (SSE 推送)。
 type EventBus struct {
 	mu          sync.RWMutex
-	subscribers map[string]chan Event
+	subscribers map[string]subscriber
+	queue       chan Event    // PublishAsync 入队, 由 drain goroutine 扇出
+	done        chan struct{} // Close 关闭, drain goroutine 随之退出
+	closeOnce   sync.Once
+	lastStatus  Event // 最近一次 agent_status (含已编码帧), 新订阅者连上即收到
 }
 
 // Event SSE 事件。
 type Event struct {
-	Type string
-	Data any
+	Type   string
+	Data   any
+	Topics []string // 路由主题 (如 sync 的 scope); 为空时以 Type 作为主题
+
+	frame []byte // Publish 预编码的 SSE 帧, 所有订阅者共享
+}
+
+// encodeSSEFrame 编码 SSE 帧, 格式与 c.SSEvent 一致 ("event:<type>\ndata:<json>\n\n")。
+func encodeSSEFrame(eventType string, data any) ([]byte, error) {
+	payload, err := json.Marshal(data)
+	if err != nil {
+		return nil, err
+	}
+	frame := make([]byte, 0, len("event:\ndata:\n\n")+len(eventType)+len(payload))
+	frame = append(frame, "event:"...)
+	frame = append(frame, eventType...)
+	frame = append(frame, "\ndata:"...)
+	frame = append(frame, payload...)
+	frame = append(frame, "\n\n"...)
+	return frame, nil
 }
 
 // NewEventBus 创建事件总线。
 func NewEventBus() *EventBus {
-	return &EventBus{subscribers: make(map[string]chan Event)}
+	b := &EventBus{
+		subscribers: make(map[string]subscriber),
+		queue:       make(chan Event, asyncQueueSize),
+		done:        make(chan struct{}),
+	}
+	util.SafeGo(b.drain)
+	return b
 }
 
 // Publish 广播事件。
+//
+// 事件在扇出前只序列化一次, 各订阅者直接写出同一帧, 不再逐连接 json.Marshal。
 func (b *EventBus) Publish(event Event) {
-	b.mu.RLock()
-	defer b.mu.RUnlock()
-	for _, ch := range b.subscribers {
+	frame, err := encodeSSEFrame(event.Type, event.Data)
+	if err != nil {
+		logger.Warn("dashboard: encode event failed", logger.FieldEventType, event.Type, logger.FieldError, err)
+		return
+	}
+	event.frame = frame
+
+	// agent_status 在同一写锁内更新缓存并扇出: 并发 SubscribeTopics 要么在此之前
+	// 加入 (只收到扇出), 要么在此之后加入 (只收到回放), 不会重复收到同一帧。
+	if event.Type == "agent_status" {
+		b.mu.Lock()
+		defer b.mu.Unlock()
+		b.lastStatus = event
+	} else {
+		b.mu.RLock()
+		defer b.mu.RUnlock()
+	}
+	for _, sub := range b.subscribers {
+		if sub.wants(event) {
+			sendDropOldest(sub.ch, event)
+		}
+	}
+}
+
+// sendDropOldest 非阻塞投递; 订阅者缓冲已满时丢弃最旧的一条再投递,
+// 慢客户端总能收到最新状态, 而不是卡在过期事件上丢掉新事件。
+func sendDropOldest(ch chan Event, event Event) {
+	select {
+	case ch <- event:
+		return
+	default:
+	}
+	select {
+	case <-ch:
+	default:
+	}
+	select {
+	case ch <- event:
+	default:
+	}
+}
+
+// PublishAsync 非阻塞入队广播, 供 HTTP 写操作调用, 扇出不占用请求 goroutine。
+// 总线关闭后直接丢弃。
+func (b *EventBus) PublishAsync(event Event) {
+	select {
+	case <-b.done:
+		return
+	default:
+	}
+	select {
+	case b.queue <- event:
+	default:
+		logger.Warn("dashboard: event queue full, dropped", logger.FieldEventType, event.Type)
+	}
+}
+
+// drain 串行消费异步队列, Close 后退出 (队列中未扇出的事件随之丢弃)。
+func (b *EventBus) drain() {
+	for {
 		select {
-		case ch <- event:
-		default:
+		case <-b.done:
+			return
+		case event := <-b.queue:
+			b.Publish(event)
 		}
 	}
 }
 
+// Close 停止异步扇出 goroutine (可重复调用); 同步 Publish 与订阅不受影响。
+func (b *EventBus) Close() {
+	b.closeOnce.Do(func() { close(b.done) })
+}
+
 // PublishAgentStatus 实现 monitor.EventPublisher 接口。
 func (b *EventBus) PublishAgentStatus(snapshot map[string]any) {
 	b.Publish(Event{Type: "agent_status", Data: snapshot})
 }
 
-// Subscribe 订阅。
+// subscriber 单个订阅者: topics 为 nil 表示接收全部事件。
+type subscriber struct {
+	ch     chan Event
+	topics map[string]struct{}
+}
+
+// wants 判断事件主题是否与订阅兴趣相交。
+func (sub subscriber) wants(event Event) bool {
+	if sub.topics == nil {
+		return true
+	}
+	if len(event.Topics) == 0 {
+		_, ok := sub.topics[event.Type]
+		return ok
+	}
+	for _, topic := range event.Topics {
+		if _, ok := sub.topics[topic]; ok {
+			return true
+		}
+	}
+	return false
+}
+
+// Subscribe 订阅全部事件。
 func (b *EventBus) Subscribe(id string) chan Event {
+	return b.SubscribeTopics(id, nil)
+}
+
+// SubscribeTopics 只订阅与 topics 相交的事件 (topics 为空等同 Subscribe)。
+//
+// 若已有 agent_status 快照且订阅者关心, 先把缓存的已编码帧放入 channel:
+// 重连风暴时各订阅者共享同一帧, 无需逐个重建快照并序列化。
+func (b *EventBus) SubscribeTopics(id string, topics []string) chan Event {
+	sub := subscriber{ch: make(chan Event, 32)}
+	if len(topics) > 0 {
+		sub.topics = make(map[string]struct{}, len(topics))
+		for _, topic := range topics {
+			sub.topics[topic] = struct{}{}
+		}
+	}
+
 	b.mu.Lock()
 	defer b.mu.Unlock()
-	ch := make(chan Event, 32)
-	b.subscribers[id] = ch
-	return ch
+	if b.lastStatus.frame != nil && sub.wants(b.lastStatus) {
+		sub.ch <- b.lastStatus
+	}
+	b.subscribers[id] = sub
+	return sub.ch
 }
 
 // Unsubscribe 取消订阅。
@@ -63,10 +207,49 @@ func (b *EventBus) Unsubscribe(id string) {
 	b.mu.Unlock()
 }
 
+// maxBurstFrames 单次 flush 最多合并写出的事件帧数。
+const maxBurstFrames = 8
+
+// writeBurst 写出 first, 并顺带取走 ch 中已就绪的事件 (至多 maxBurstFrames 帧),
+// 让突发事件共用一次 flush; ch 为空时立即返回, 不引入额外延迟。
+// 各帧保持独立 SSE 事件, 客户端无需改动。
+func writeBurst(w io.Writer, first Event, ch <-chan Event) error {
+	if _, err := w.Write(first.frame); err != nil {
+		return err
+	}
+	for i := 1; i < maxBurstFrames; i++ {
+		select {
+		case evt, ok := <-ch:
+			if !ok {
+				return nil
+			}
+			if _, err := w.Write(evt.frame); err != nil {
+				return err
+			}
+		default:
+			return nil
+		}
+	}
+	return nil
+}
+
+// queryTopics 解析 ?topics=a,b (逗号分隔); 缺省返回 nil 表示订阅全部事件。
+func queryTopics(c *gin.Context) []string {
+	var topics []string
+	for _, t := range strings.Split(c.Query("topics"), ",") {
+		if t = strings.TrimSpace(t); t != "" {
+			topics = append(topics, t)
+		}
+	}
+	return topics
+}
+
 // sseHandler Gin SSE handler。
+//
+// 支持 ?topics=approvals,agent_status 只接收相关事件, 其它事件不唤醒该连接。
 func (s *Server) sseHandler(c *gin.Context) {
 	clientID := fmt.Sprintf("sse-%d", time.Now().UnixNano())
-	ch := s.bus.Subscribe(clientID)
+	ch := s.bus.SubscribeTopics(clientID, queryTopics(c))
 	defer func() {
 		s.bus.Unsubscribe(clientID)
 		logger.Info("dashboard: SSE client disconnected", "client_id", clientID)
@@ -74,33 +257,38 @@ func (s *Server) sseHandler(c *gin.Context) {
 
 	logger.Info("dashboard: SSE client connected", "client_id", clientID)
 
+	c.Header("Content-Type", "text/event-stream")
+	c.Header("Cache-Control", "no-cache")
+	c.Header("X-Accel-Buffering", "no") // 反向代理 (nginx) 不缓冲事件流
+	// 每个连接只建一个 timer, 间隔在 NewServer 时已解析
+	keepalive := time.NewTimer(s.keepalive)
+	defer keepalive.Stop()
+
 	c.Stream(func(w io.Writer) bool {
-		// 复用 timer 避免每次循环创建新定时器 (GC 压力)
-		keepalive := time.NewTimer(30 * time.Second)
-		defer keepalive.Stop()
-
-		for {
-			select {
-			case evt, ok := <-ch:
-				if !ok {
-					return false
-				}
-				c.SSEvent(evt.Type, evt.Data)
-				if !keepalive.Stop() {
-					select {
-					case <-keepalive.C:
-					default:
-					}
+		select {
+		case evt, ok := <-ch:
+			if !ok {
+				return false
+			}
+			if err := writeBurst(w, evt, ch); err != nil {
+				return false
+			}
+			if !keepalive.Stop() {
+				select {
+				case <-keepalive.C:
+				default:
 				}
-				keepalive.Reset(30 * time.Second)
-				return true
-			case <-keepalive.C:
-				c.SSEvent("ping", "keepalive")
-				keepalive.Reset(30 * time.Second)
-				return true
-			case <-c.Request.Context().Done():
+			}
+			keepalive.Reset(s.keepalive)
+			return true
+		case <-keepalive.C:
+			if _, err := w.Write(keepaliveFrame); err != nil {
 				return false
 			}
+			keepalive.Reset(s.keepalive)
+			return true
+		case <-c.Request.Context().Done():
+			return false
 		}
 	})
 }
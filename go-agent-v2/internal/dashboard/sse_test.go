@@ -0,0 +1,167 @@
+package dashboard
+
+import (
+	"bytes"
+	"strconv"
+	"sync"
+	"testing"
+	"time"
+)
+
+// TestPublish_SharesPreEncodedFrame 事件只编码一次, 订阅者收到与 c.SSEvent 同格式的帧。
+func TestPublish_SharesPreEncodedFrame(t *testing.T) {
+	b := NewEventBus()
+	defer b.Close()
+	ch1 := b.Subscribe("c1")
+	ch2 := b.Subscribe("c2")
+	defer b.Unsubscribe("c1")
+	defer b.Unsubscribe("c2")
+
+	b.Publish(Event{Type: "sync", Data: map[string]any{"scope": []string{"approvals"}}})
+
+	want := "event:sync\ndata:{\"scope\":[\"approvals\"]}\n\n"
+	e1, e2 := <-ch1, <-ch2
+	if string(e1.frame) != want {
+		t.Fatalf("frame = %q, want %q", e1.frame, want)
+	}
+	if &e1.frame[0] != &e2.frame[0] {
+		t.Fatal("subscribers should share the same encoded frame")
+	}
+}
+
+// TestKeepaliveFrame_MatchesEncoder 预编码心跳帧与 c.SSEvent("ping", "keepalive") 输出一致。
+func TestKeepaliveFrame_MatchesEncoder(t *testing.T) {
+	if got, want := string(keepaliveFrame), "event:ping\ndata:keepalive\n\n"; got != want {
+		t.Fatalf("keepaliveFrame = %q, want %q", got, want)
+	}
+}
+
+// TestWriteBurst 合并写出已就绪事件, 上限 maxBurstFrames, 其余留在 channel。
+func TestWriteBurst(t *testing.T) {
+	ch := make(chan Event, 16)
+	for i := 0; i < 10; i++ {
+		ch <- Event{frame: []byte("x")}
+	}
+	var buf bytes.Buffer
+	if err := writeBurst(&buf, Event{frame: []byte("x")}, ch); err != nil {
+		t.Fatalf("writeBurst: %v", err)
+	}
+	if buf.Len() != maxBurstFrames {
+		t.Fatalf("wrote %d frames, want %d", buf.Len(), maxBurstFrames)
+	}
+	if left := len(ch); left != 10-(maxBurstFrames-1) {
+		t.Fatalf("left %d events in channel, want %d", left, 10-(maxBurstFrames-1))
+	}
+}
+
+// TestSubscribe_ReplaysLastAgentStatus 新订阅者立即收到最近一次 agent_status 的缓存帧。
+func TestSubscribe_ReplaysLastAgentStatus(t *testing.T) {
+	b := NewEventBus()
+	defer b.Close()
+	if ch := b.Subscribe("early"); len(ch) != 0 {
+		t.Fatalf("early subscriber got %d events before any status, want 0", len(ch))
+	}
+	b.Unsubscribe("early")
+
+	b.PublishAgentStatus(map[string]any{"total": 1})
+	b.Publish(Event{Type: "sync", Data: map[string]any{}})
+
+	ch := b.Subscribe("late")
+	defer b.Unsubscribe("late")
+	if len(ch) != 1 {
+		t.Fatalf("late subscriber got %d events, want 1", len(ch))
+	}
+	evt := <-ch
+	if want := "event:agent_status\ndata:{\"total\":1}\n\n"; evt.Type != "agent_status" || string(evt.frame) != want {
+		t.Fatalf("replayed %q %q, want agent_status %q", evt.Type, evt.frame, want)
+	}
+}
+
+// TestSubscribe_ConcurrentWithStatusPublishSeesFrameOnce 与 agent_status 发布并发的订阅者
+// 只收到一次该帧 (回放或扇出之一)。
+func TestSubscribe_ConcurrentWithStatusPublishSeesFrameOnce(t *testing.T) {
+	b := NewEventBus()
+	defer b.Close()
+	const n = 64
+	chans := make([]chan Event, n)
+	var wg sync.WaitGroup
+	wg.Add(n + 1)
+	go func() {
+		defer wg.Done()
+		b.PublishAgentStatus(map[string]any{"total": 1})
+	}()
+	for i := range chans {
+		go func(i int) {
+			defer wg.Done()
+			chans[i] = b.Subscribe("c" + strconv.Itoa(i))
+		}(i)
+	}
+	wg.Wait()
+	for i, ch := range chans {
+		if got := len(ch); got != 1 {
+			t.Fatalf("subscriber %d got %d agent_status frames, want 1", i, got)
+		}
+	}
+}
+
+// TestEventBusClose_StopsAsyncFanOut Close 后 drain 退出, PublishAsync 不再投递。
+func TestEventBusClose_StopsAsyncFanOut(t *testing.T) {
+	b := NewEventBus()
+	ch := b.Subscribe("c1")
+	b.Close()
+	b.Close() // 可重复调用
+
+	b.PublishAsync(Event{Type: "sync", Data: map[string]any{}})
+	select {
+	case evt := <-ch:
+		t.Fatalf("got %q after Close, want nothing", evt.Type)
+	case <-time.After(50 * time.Millisecond):
+	}
+	if got := len(b.queue); got != 0 {
+		t.Fatalf("queue length after Close = %d, want 0", got)
+	}
+}
+
+func TestSSEKeepalive_Clamped(t *testing.T) {
+	cases := map[int]time.Duration{0: time.Second, 5: 5 * time.Second, 60: time.Minute, 600: time.Minute}
+	for sec, want := range cases {
+		if got := sseKeepalive(sec); got != want {
+			t.Errorf("sseKeepalive(%d) = %v, want %v", sec, got, want)
+		}
+	}
+}
+
+// TestSendDropOldest 缓冲已满时丢弃最旧事件, 保留最新事件。
+func TestSendDropOldest(t *testing.T) {
+	ch := make(chan Event, 2)
+	sendDropOldest(ch, Event{Type: "e1"})
+	sendDropOldest(ch, Event{Type: "e2"})
+	sendDropOldest(ch, Event{Type: "e3"})
+
+	if got := []string{(<-ch).Type, (<-ch).Type}; got[0] != "e2" || got[1] != "e3" {
+		t.Fatalf("channel = %v, want [e2 e3]", got)
+	}
+}
+
+// TestSubscribeTopics_FiltersByScope 主题订阅者只收到与其兴趣相交的事件。
+func TestSubscribeTopics_FiltersByScope(t *testing.T) {
+	b := NewEventBus()
+	defer b.Close()
+	all := b.Subscribe("all")
+	approvals := b.SubscribeTopics("approvals", []string{"approvals"})
+	status := b.SubscribeTopics("status", []string{"agent_status"})
+
+	b.Publish(Event{Type: "sync", Data: map[string]any{}, Topics: []string{"approvals"}})
+	b.Publish(Event{Type: "sync", Data: map[string]any{}, Topics: []string{"command_cards"}})
+	b.PublishAgentStatus(map[string]any{"total": 0})
+
+	if got := len(all); got != 3 {
+		t.Fatalf("all subscriber got %d events, want 3", got)
+	}
+	if got := len(approvals); got != 1 {
+		t.Fatalf("approvals subscriber got %d events, want 1", got)
+	}
+	if got := len(status); got != 1 || (<-status).Type != "agent_status" {
+		t.Fatalf("agent_status subscriber got %d events, want 1 agent_status", got)
+	}
+}
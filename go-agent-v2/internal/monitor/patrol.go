@@ -6,6 +6,8 @@ package monitor
 
 import (
 	"context"
+	"maps"
+	"slices"
 	"strings"
 	"sync"
 	"time"
@@ -28,6 +30,9 @@ var (
 const (
 	defaultStuckSec    = 60
 	defaultIntervalSec = 5
+
+	// maxTailLines 字符串形式的 output_tail 只取最后这么多行 (与 store.normalizeOutputTail 的上限一致)。
+	maxTailLines = 50
 )
 
 // StatusNames 有效状态名。
@@ -39,8 +44,9 @@ var StatusNames = []string{"running", "idle", "stuck", "error", "disconnected",
 
 // Patrol Agent 巡检器。
 type Patrol struct {
-	agentStore *store.AgentStatusStore
-	eventBus   EventPublisher
+	agentStore  *store.AgentStatusStore
+	eventBus    EventPublisher
+	upsertLimit int // 单轮巡检并发持久化上限, 见 upsertConcurrency
 
 	mu     sync.Mutex              // 保护 memory (输出指纹缓存)
 	memory map[string]*fingerprint // 输出指纹缓存
@@ -58,11 +64,22 @@ type fingerprint struct {
 
 // NewPatrol 创建巡检器。
 func NewPatrol(as *store.AgentStatusStore, bus EventPublisher) *Patrol {
-	return &Patrol{
-		agentStore: as,
-		eventBus:   bus,
-		memory:     make(map[string]*fingerprint),
+	p := &Patrol{
+		agentStore:  as,
+		eventBus:    bus,
+		upsertLimit: 1,
+		memory:      make(map[string]*fingerprint),
+	}
+	if as != nil {
+		p.upsertLimit = upsertConcurrency(as.MaxConns())
 	}
+	return p
+}
+
+// upsertConcurrency 按连接池容量推算巡检并发持久化上限: 取约一半 (至少 1),
+// 其余连接留给 API 请求, 连接池调小时巡检并发随之收缩。
+func upsertConcurrency(maxConns int) int {
+	return max(1, maxConns/2)
 }
 
 // ========================================
@@ -127,8 +144,9 @@ func (p *Patrol) RunOnce(ctx context.Context) *PatrolResult {
 		return &PatrolResult{OK: false, Ts: now, Error: err.Error(), Summary: emptySummary()}
 	}
 
-	var snapshots []AgentSnapshot
-	for _, a := range agents {
+	snapshots := make([]AgentSnapshot, 0, len(agents))
+	for i := range agents {
+		a := &agents[i]
 		// 解析一次，重用结果 (避免 3 次重复 parseOutputTail)
 		lines := parseOutputTail(a.OutputTail)
 
@@ -150,13 +168,10 @@ func (p *Patrol) RunOnce(ctx context.Context) *PatrolResult {
 		}
 		snapshots = append(snapshots, snap)
 
-		// 持久化更新后的状态
 		a.Status = status
 		a.StagnantSec = stagnant
-		if _, err := p.agentStore.Upsert(ctx, &a); err != nil {
-			logger.Warn("patrol: upsert failed", logger.FieldAgentID, a.AgentID, logger.FieldError, err)
-		}
 	}
+	p.persist(ctx, agents)
 
 	result := &PatrolResult{
 		OK:      true,
@@ -210,6 +225,27 @@ func (p *Patrol) Start(ctx context.Context) {
 // 内部工具 (DRY: 共享逻辑)
 // ========================================
 
+// persist 并发写回巡检后的状态 (每个 Upsert 是一次 DB 往返, 串行时耗时随 Agent 数线性增长)。
+func (p *Patrol) persist(ctx context.Context, agents []store.AgentStatus) {
+	var wg sync.WaitGroup
+	sem := make(chan struct{}, max(1, p.upsertLimit))
+	for i := range agents {
+		a := &agents[i]
+		sem <- struct{}{}
+		wg.Add(1)
+		util.SafeGo(func() {
+			defer func() {
+				<-sem
+				wg.Done()
+			}()
+			if _, err := p.agentStore.Upsert(ctx, a); err != nil {
+				logger.Warn("patrol: upsert failed", logger.FieldAgentID, a.AgentID, logger.FieldError, err)
+			}
+		})
+	}
+	wg.Wait()
+}
+
 // computeStagnantFromLines 计算输出停滞时间 (指纹对比)。
 // 接受已解析的 lines，避免重复调用 parseOutputTail。
 func (p *Patrol) computeStagnantFromLines(agentID string, lines []string, now time.Time) int {
@@ -242,19 +278,38 @@ func parseOutputTail(v any) []string {
 		if val == "" {
 			return nil
 		}
-		return strings.Split(val, "\n")
+		return tailLines(val, maxTailLines)
 	case []any:
-		var out []string
-		for _, item := range val {
-			if s, ok := item.(string); ok && strings.TrimSpace(s) != "" {
+		// 与字符串分支一致只保留最后 maxTailLines 行: 反向收集, 满额即停
+		out := make([]string, 0, min(len(val), maxTailLines))
+		for i := len(val) - 1; i >= 0 && len(out) < maxTailLines; i-- {
+			if s, ok := val[i].(string); ok && strings.TrimSpace(s) != "" {
 				out = append(out, s)
 			}
 		}
+		if len(out) == 0 {
+			return nil
+		}
+		slices.Reverse(out)
 		return out
 	}
 	return nil
 }
 
+// tailLines 从末尾反向扫描, 只切出最后 n 行;
+// 工作量只与这 n 行的长度有关, 不随整段终端缓冲增长。
+func tailLines(s string, n int) []string {
+	out := make([]string, 0, n)
+	end := len(s)
+	for end >= 0 && len(out) < n {
+		start := strings.LastIndexByte(s[:end], '\n') + 1
+		out = append(out, s[start:end])
+		end = start - 1
+	}
+	slices.Reverse(out)
+	return out
+}
+
 func normalizeLines(lines []string) []string {
 	var out []string
 	for _, l := range lines {
@@ -294,22 +349,32 @@ func containsAny(text string, keywords []string) bool {
 	return false
 }
 
-func emptySummary() map[string]int {
-	m := map[string]int{"total": 0, "healthy": 0, "unhealthy": 0}
+// summaryTemplate 全零汇总模板, 启动时构建一次; 每轮巡检 maps.Clone 一份,
+// 不再逐键插入 (Clone 按模板容量一次分配)。
+var summaryTemplate = func() map[string]int {
+	m := make(map[string]int, len(StatusNames)+3)
+	m["total"], m["healthy"], m["unhealthy"] = 0, 0, 0
 	for _, name := range StatusNames {
 		m[name] = 0
 	}
 	return m
+}()
+
+func emptySummary() map[string]int {
+	return maps.Clone(summaryTemplate)
 }
 
 func summarize(agents []AgentSnapshot) map[string]int {
 	s := emptySummary()
+	healthy := 0
 	for _, a := range agents {
-		status := a.Status
-		s[status]++
-		s["total"]++
+		s[a.Status]++
+		if a.Status == "running" || a.Status == "idle" {
+			healthy++
+		}
 	}
-	s["healthy"] = s["running"] + s["idle"]
-	s["unhealthy"] = s["total"] - s["healthy"]
+	s["total"] = len(agents)
+	s["healthy"] = healthy
+	s["unhealthy"] = len(agents) - healthy
 	return s
 }
@@ -2,6 +2,8 @@ package monitor
 
 import (
 	"os"
+	"slices"
+	"strconv"
 	"strings"
 	"testing"
 )
@@ -29,3 +31,75 @@ func TestPatrolUpsertFail_UsesWarnLevel(t *testing.T) {
 		t.Fatal("patrol.go: expected logger.Warn(\"patrol: upsert failed\", ...)")
 	}
 }
+
+func TestTailLines_MatchesSplitSuffix(t *testing.T) {
+	long := strings.Repeat("line\n", 200) + "last"
+	cases := []struct {
+		in string
+		n  int
+	}{
+		{"a", 3},
+		{"a\nb", 3},
+		{"a\n", 3},
+		{"\n\n", 5},
+		{"a\nb\nc\nd", 2},
+		{long, maxTailLines},
+	}
+	for _, tc := range cases {
+		all := strings.Split(tc.in, "\n")
+		want := all[max(0, len(all)-tc.n):]
+		if got := tailLines(tc.in, tc.n); !slices.Equal(got, want) {
+			t.Errorf("tailLines(%q, %d) = %q, want %q", tc.in, tc.n, got, want)
+		}
+	}
+}
+
+func TestParseOutputTail_AnySliceKeepsLastNonBlank(t *testing.T) {
+	in := []any{"a", " ", 1, "b"}
+	if got := parseOutputTail(in); !slices.Equal(got, []string{"a", "b"}) {
+		t.Fatalf("parseOutputTail(%v) = %q", in, got)
+	}
+	if got := parseOutputTail([]any{" ", 2}); got != nil {
+		t.Fatalf("blank-only tail should be nil, got %q", got)
+	}
+
+	long := make([]any, 0, maxTailLines+10)
+	for i := range maxTailLines + 10 {
+		long = append(long, strconv.Itoa(i))
+	}
+	got := parseOutputTail(long)
+	if len(got) != maxTailLines || got[0] != "10" || got[len(got)-1] != strconv.Itoa(maxTailLines+9) {
+		t.Fatalf("long tail = %d lines [%s..%s]", len(got), got[0], got[len(got)-1])
+	}
+}
+
+func TestSummarize(t *testing.T) {
+	got := summarize([]AgentSnapshot{
+		{Status: "running"}, {Status: "idle"}, {Status: "stuck"}, {Status: "error"}, {Status: "running"},
+	})
+	want := map[string]int{
+		"total": 5, "healthy": 3, "unhealthy": 2,
+		"running": 2, "idle": 1, "stuck": 1, "error": 1, "disconnected": 0, "unknown": 0,
+	}
+	for k, v := range want {
+		if got[k] != v {
+			t.Errorf("summary[%q] = %d, want %d", k, got[k], v)
+		}
+	}
+
+	// 模板不能被某一轮的计数污染
+	empty := emptySummary()
+	if len(empty) != len(StatusNames)+3 || empty["running"] != 0 || empty["total"] != 0 {
+		t.Fatalf("emptySummary() = %v", empty)
+	}
+}
+
+// TestUpsertConcurrency 并发上限约为连接池容量的一半, 且至少为 1。
+func TestUpsertConcurrency(t *testing.T) {
+	cases := map[int]int{0: 1, 1: 1, 2: 1, 3: 1, 4: 2, 10: 5, 25: 12}
+	for maxConns, want := range cases {
+		if got := upsertConcurrency(maxConns); got != want {
+			t.Errorf("upsertConcurrency(%d) = %d, want %d", maxConns, got, want)
+		}
+	}
+}
@@ -49,6 +49,11 @@ func trimTaskText(task string, maxChars int) string {
 // extractJSON (对应 Python _extract_json)
 // ========================================
 
+// extractJSON 返回 text 中第一个可解析的 JSON 对象。
+//
+// 按字节扫描: JSON 结构字符均为 ASCII, 而 UTF-8 多字节字符不含 ASCII 字节,
+// 因此无需先转 []rune; 用 IndexByte 直接跳到下一个 '{', 括号栈跨候选复用。
+//
 //nolint:unused // DELETE_CANDIDATE[2026-02-22]: 预留给 Master 编排器调度逻辑
 func extractJSON(text string) map[string]any {
 	src := strings.TrimSpace(text)
@@ -56,18 +61,20 @@ func extractJSON(text string) map[string]any {
 		return nil
 	}
 
-	runes := []rune(src)
-	for start := 0; start < len(runes); start++ {
-		if runes[start] != '{' {
-			continue
+	var stack []byte
+	for start := 0; start < len(src); start++ {
+		next := strings.IndexByte(src[start:], '{')
+		if next < 0 {
+			return nil
 		}
+		start += next
 
-		stack := []rune{'}'}
+		stack = append(stack[:0], '}')
 		inString := false
 		escaped := false
 
-		for idx := start + 1; idx < len(runes); idx++ {
-			ch := runes[idx]
+		for idx := start + 1; idx < len(src); idx++ {
+			ch := src[idx]
 
 			if inString {
 				if escaped {
@@ -80,38 +87,32 @@ func extractJSON(text string) map[string]any {
 				continue
 			}
 
-			if ch == '"' {
+			switch ch {
+			case '"':
 				inString = true
 				continue
-			}
-			if ch == '{' {
+			case '{':
 				stack = append(stack, '}')
 				continue
-			}
-			if ch == '[' {
+			case '[':
 				stack = append(stack, ']')
 				continue
-			}
-			if ch != '}' && ch != ']' {
+			case '}', ']':
+			default:
 				continue
 			}
 
-			if len(stack) == 0 {
-				break
-			}
 			expected := stack[len(stack)-1]
 			stack = stack[:len(stack)-1]
 			if ch != expected {
 				break
 			}
-
 			if len(stack) > 0 {
 				continue
 			}
 
-			candidate := string(runes[start : idx+1])
 			var parsed map[string]any
-			if err := json.Unmarshal([]byte(candidate), &parsed); err != nil {
+			if err := json.Unmarshal([]byte(src[start:idx+1]), &parsed); err != nil {
 				break
 			}
 			return parsed
@@ -1,6 +1,9 @@
 package orchestrator
 
-import "testing"
+import (
+	"fmt"
+	"testing"
+)
 
 func TestSanitizeGateway(t *testing.T) {
 	seen := map[string]bool{}
@@ -96,3 +99,31 @@ func TestSanitizeTopology_MissingKeys_NoPanic(t *testing.T) {
 		t.Fatal("expected nil result when no agents present")
 	}
 }
+
+func TestExtractJSON(t *testing.T) {
+	cases := []struct {
+		name string
+		text string
+		want any // nil 表示无结果, 否则为 "k" 字段期望值
+	}{
+		{name: "plain", text: `{"k":"v"}`, want: "v"},
+		{name: "fenced", text: "结论如下:\n```json\n{\"k\": \"中文}\"}\n```", want: "中文}"},
+		{name: "nested", text: `prefix {"k": {"a": [1, {"b": 2}]}} suffix`, want: map[string]any{"a": []any{float64(1), map[string]any{"b": float64(2)}}}},
+		{name: "skip invalid", text: `{bad} then {"k":"ok"}`, want: "ok"},
+		{name: "mismatched", text: `{"k": [}`, want: nil},
+		{name: "none", text: "no json here", want: nil},
+		{name: "empty", text: "  ", want: nil},
+	}
+	for _, tc := range cases {
+		got := extractJSON(tc.text)
+		if tc.want == nil {
+			if got != nil {
+				t.Errorf("%s: got %v, want nil", tc.name, got)
+			}
+			continue
+		}
+		if got == nil || fmt.Sprint(got["k"]) != fmt.Sprint(tc.want) {
+			t.Errorf("%s: got %v, want k=%v", tc.name, got, tc.want)
+		}
+	}
+}
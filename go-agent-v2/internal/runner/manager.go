@@ -532,7 +532,12 @@ func (m *AgentManager) List() []AgentInfo {
 	}
 	m.mu.RUnlock()
 
-	infos := make([]AgentInfo, 0, len(snapshot))
+	// 排序键 (TrimSpace 后的 ID/Name) 每个 Agent 只算一次, 比较函数里不再重复裁剪
+	type sortEntry struct {
+		info     AgentInfo
+		id, name string
+	}
+	entries := make([]sortEntry, 0, len(snapshot))
 	for _, proc := range snapshot {
 		proc.mu.Lock()
 		info := AgentInfo{
@@ -544,21 +549,25 @@ func (m *AgentManager) List() []AgentInfo {
 			LastReport: proc.LastReport,
 		}
 		proc.mu.Unlock()
-		infos = append(infos, info)
-	}
-	sort.SliceStable(infos, func(i, j int) bool {
-		leftID := strings.TrimSpace(infos[i].ID)
-		rightID := strings.TrimSpace(infos[j].ID)
-		if leftID != rightID {
-			return leftID > rightID
+		entries = append(entries, sortEntry{
+			info: info,
+			id:   strings.TrimSpace(info.ID),
+			name: strings.TrimSpace(info.Name),
+		})
+	}
+	sort.SliceStable(entries, func(i, j int) bool {
+		if entries[i].id != entries[j].id {
+			return entries[i].id > entries[j].id
 		}
-		leftName := strings.TrimSpace(infos[i].Name)
-		rightName := strings.TrimSpace(infos[j].Name)
-		if leftName != rightName {
-			return leftName > rightName
+		if entries[i].name != entries[j].name {
+			return entries[i].name > entries[j].name
 		}
-		return infos[i].Port > infos[j].Port
+		return entries[i].info.Port > entries[j].info.Port
 	})
+	infos := make([]AgentInfo, len(entries))
+	for i := range entries {
+		infos[i] = entries[i].info
+	}
 	return infos
 }
 
@@ -11,6 +11,7 @@ import (
 	"path/filepath"
 	"sort"
 	"strings"
+	"sync"
 	"time"
 	"unicode/utf8"
 
@@ -67,6 +68,16 @@ type SkillImportResult struct {
 // SkillService 统一管理技能存储。
 type SkillService struct {
 	dir string
+
+	metaMu    sync.Mutex
+	metaCache map[string]skillMetaCacheEntry // SKILL.md 路径 → 按 (mtime, size) 校验的元数据
+}
+
+// skillMetaCacheEntry 缓存的 SKILL.md 元数据及其文件指纹。
+type skillMetaCacheEntry struct {
+	modTime time.Time
+	size    int64
+	meta    skillMetadata
 }
 
 type skillRecord struct {
@@ -142,6 +153,33 @@ func (s *SkillService) writeSkillIndex(dirPath, name string) error {
 	return os.WriteFile(filepath.Join(dirPath, skillIndexFile), data, 0o644)
 }
 
+// cachedSkillMetadata 返回 SKILL.md 的元数据; 文件 mtime 与 size 未变时复用缓存,
+// 避免每次解析技能名 (每个 turn 注入技能都会全量扫描) 都重读并解析所有 SKILL.md。
+func (s *SkillService) cachedSkillMetadata(path string, info os.FileInfo) skillMetadata {
+	s.metaMu.Lock()
+	entry, ok := s.metaCache[path]
+	s.metaMu.Unlock()
+	if ok && entry.size == info.Size() && entry.modTime.Equal(info.ModTime()) {
+		return entry.meta
+	}
+
+	meta := extractSkillMetadata(path)
+	s.metaMu.Lock()
+	if s.metaCache == nil {
+		s.metaCache = make(map[string]skillMetaCacheEntry)
+	}
+	s.metaCache[path] = skillMetaCacheEntry{modTime: info.ModTime(), size: info.Size(), meta: meta}
+	s.metaMu.Unlock()
+	return meta
+}
+
+// invalidateSkillMetadata 清空元数据缓存 (写操作后调用, 防止同一 mtime 粒度内的改写被误判为未变)。
+func (s *SkillService) invalidateSkillMetadata() {
+	s.metaMu.Lock()
+	s.metaCache = nil
+	s.metaMu.Unlock()
+}
+
 func (s *SkillService) scanSkillRecords() ([]skillRecord, error) {
 	entries, err := os.ReadDir(s.byIDRoot())
 	if err != nil {
@@ -171,7 +209,7 @@ func (s *SkillService) scanSkillRecords() ([]skillRecord, error) {
 			DirPath:    dirPath,
 			SkillPath:  skillPath,
 			StoredName: s.readSkillIndex(dirPath).Name,
-			Meta:       extractSkillMetadata(skillPath),
+			Meta:       s.cachedSkillMetadata(skillPath, info),
 		})
 	}
 
@@ -287,6 +325,7 @@ func (s *SkillService) ReadSkillDigest(name string) (SkillDigest, error) {
 
 // WriteSkillContent 覆盖写入技能内容并更新索引。
 func (s *SkillService) WriteSkillContent(name, content string) (string, error) {
+	defer s.invalidateSkillMetadata()
 	storedName := strings.TrimSpace(name)
 	if storedName == "" {
 		return "", apperrors.New("SkillService.WriteSkillContent", "skill name is required")
@@ -318,6 +357,7 @@ func (s *SkillService) WriteSkillContent(name, content string) (string, error) {
 
 // UpdateSkillSummary 更新技能 frontmatter summary 字段。
 func (s *SkillService) UpdateSkillSummary(name, summary string) (skillPath string, resolvedName string, err error) {
+	defer s.invalidateSkillMetadata()
 	record, err := s.resolveSkillRecord(name)
 	if err != nil {
 		return "", "", err
@@ -340,6 +380,7 @@ func (s *SkillService) UpdateSkillSummary(name, summary string) (skillPath strin
 
 // DeleteSkill 删除技能目录。
 func (s *SkillService) DeleteSkill(name string) (resolvedName string, dir string, err error) {
+	defer s.invalidateSkillMetadata()
 	record, err := s.resolveSkillRecord(name)
 	if err != nil {
 		return "", "", err
@@ -356,6 +397,7 @@ func (s *SkillService) DeleteSkill(name string) (resolvedName string, dir string
 
 // ImportSkillDirectory 导入技能目录到 by-id 存储。
 func (s *SkillService) ImportSkillDirectory(sourceDir, name string) (SkillImportResult, error) {
+	defer s.invalidateSkillMetadata()
 	info, err := os.Stat(sourceDir)
 	if err != nil {
 		return SkillImportResult{}, apperrors.Wrap(err, "SkillService.ImportSkillDirectory", "stat source dir")
@@ -306,3 +306,29 @@ description: "%s"
 		t.Fatalf("description should keep full text, got=%q", meta.Description)
 	}
 }
+
+func TestListSkillsRefreshesMetadataWhenFileChanges(t *testing.T) {
+	tmp := t.TempDir()
+	svc := NewSkillService(tmp)
+	path, err := svc.WriteSkillContent("backend", "---\nsummary: \"旧摘要\"\n---\n# Backend")
+	if err != nil {
+		t.Fatalf("WriteSkillContent: %v", err)
+	}
+
+	skills, err := svc.ListSkills()
+	if err != nil || len(skills) != 1 || skills[0].Summary != "旧摘要" {
+		t.Fatalf("first ListSkills = %+v, %v", skills, err)
+	}
+	if len(svc.metaCache) != 1 {
+		t.Fatalf("metaCache size=%d, want 1 after scan", len(svc.metaCache))
+	}
+
+	// 绕过 SkillService 直接改写文件: 依赖 size/mtime 变化使缓存失效
+	if err := os.WriteFile(path, []byte("---\nsummary: \"新的更长的摘要\"\n---\n# Backend"), 0o644); err != nil {
+		t.Fatalf("rewrite SKILL.md: %v", err)
+	}
+	skills, err = svc.ListSkills()
+	if err != nil || len(skills) != 1 || skills[0].Summary != "新的更长的摘要" {
+		t.Fatalf("ListSkills after rewrite = %+v, %v", skills, err)
+	}
+}
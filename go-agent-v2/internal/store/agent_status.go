@@ -4,7 +4,6 @@ package store
 
 import (
 	"context"
-	"regexp"
 
 	"github.com/jackc/pgx/v5/pgxpool"
 
@@ -19,7 +18,11 @@ func NewAgentStatusStore(pool *pgxpool.Pool) *AgentStatusStore {
 	return &AgentStatusStore{NewBaseStore(pool)}
 }
 
-var agentIDRe = regexp.MustCompile(`^[A-Za-z0-9_.-]+$`)
+// isAgentIDChar 报告 c 是否属于 agent_id 允许字符集 [A-Za-z0-9_.-]。
+func isAgentIDChar(c byte) bool {
+	return c >= 'a' && c <= 'z' || c >= 'A' && c <= 'Z' || c >= '0' && c <= '9' ||
+		c == '_' || c == '.' || c == '-'
+}
 
 var validStatuses = map[string]bool{
 	"idle": true, "running": true, "stagnant": true,
@@ -29,10 +32,16 @@ var validStatuses = map[string]bool{
 const asCols = "agent_id, agent_name, session_id, status, stagnant_sec, error, output_tail, created_at, updated_at"
 
 // validateAgentID 验证 agent_id 格式 (对应 Python _normalize_agent_id)。
+// 逐字节扫描代替正则匹配: 巡检每轮对每个 Agent 都会调用, 无需走 regexp 引擎。
 func validateAgentID(id string) error {
-	if id == "" || !agentIDRe.MatchString(id) {
+	if id == "" {
 		return apperrors.Newf("validateAgentID", "agent_id 格式非法: %q", id)
 	}
+	for i := 0; i < len(id); i++ {
+		if !isAgentIDChar(id[i]) {
+			return apperrors.Newf("validateAgentID", "agent_id 格式非法: %q", id)
+		}
+	}
 	return nil
 }
 
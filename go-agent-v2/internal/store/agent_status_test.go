@@ -0,0 +1,18 @@
+package store
+
+import "testing"
+
+func TestValidateAgentID(t *testing.T) {
+	valid := []string{"a", "agent-1", "Agent_2.worker", "0.9-x_Y"}
+	for _, id := range valid {
+		if err := validateAgentID(id); err != nil {
+			t.Errorf("validateAgentID(%q) = %v, want nil", id, err)
+		}
+	}
+	invalid := []string{"", "a b", "a/b", "agent:1", "中文", "a\n"}
+	for _, id := range invalid {
+		if err := validateAgentID(id); err == nil {
+			t.Errorf("validateAgentID(%q) = nil, want error", id)
+		}
+	}
+}
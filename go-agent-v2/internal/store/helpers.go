@@ -10,6 +10,7 @@ import (
 	"context"
 	"encoding/json"
 	"fmt"
+	"strconv"
 	"strings"
 
 	"github.com/jackc/pgx/v5"
@@ -49,6 +50,14 @@ type BaseStore struct{ pool *pgxpool.Pool }
 // NewBaseStore 创建 BaseStore。
 func NewBaseStore(pool *pgxpool.Pool) BaseStore { return BaseStore{pool: pool} }
 
+// MaxConns 返回连接池容量上限 (未注入连接池时为 0), 供调用方限制自身并发。
+func (b BaseStore) MaxConns() int {
+	if b.pool == nil {
+		return 0
+	}
+	return int(b.pool.Config().MaxConns)
+}
+
 // ========================================
 // QueryBuilder — 动态 WHERE 子句构造
 // ========================================
@@ -72,7 +81,7 @@ func (q *QueryBuilder) Eq(col, val string) *QueryBuilder {
 		return q
 	}
 	q.n++
-	q.where = append(q.where, fmt.Sprintf("%s = $%d", col, q.n))
+	q.where = append(q.where, col+" = $"+strconv.Itoa(q.n))
 	q.params = append(q.params, val)
 	return q
 }
@@ -95,19 +104,36 @@ func (q *QueryBuilder) KeywordLike(keyword string, cols ...string) *QueryBuilder
 }
 
 // Build 构建完整 SQL: baseSql + WHERE + ORDER BY + LIMIT。
+//
+// 按最终长度预分配一次写入, 不再逐段 += 拼接产生中间字符串。
 func (q *QueryBuilder) Build(baseSql, orderBy string, limit int) (string, []any) {
 	limit = util.ClampInt(limit, 1, 2000)
-	sql := baseSql
-	if len(q.where) > 0 {
-		sql += " WHERE " + strings.Join(q.where, " AND ")
+	q.n++
+	limitArg := strconv.Itoa(q.n)
+
+	size := len(baseSql) + len(" WHERE ") + len(" ORDER BY ") + len(orderBy) + len(" LIMIT $") + len(limitArg)
+	for _, w := range q.where {
+		size += len(w) + len(" AND ")
+	}
+	var b strings.Builder
+	b.Grow(size)
+	b.WriteString(baseSql)
+	for i, w := range q.where {
+		if i == 0 {
+			b.WriteString(" WHERE ")
+		} else {
+			b.WriteString(" AND ")
+		}
+		b.WriteString(w)
 	}
 	if orderBy != "" {
-		sql += " ORDER BY " + orderBy
+		b.WriteString(" ORDER BY ")
+		b.WriteString(orderBy)
 	}
-	q.n++
-	sql += fmt.Sprintf(" LIMIT $%d", q.n)
+	b.WriteString(" LIMIT $")
+	b.WriteString(limitArg)
 	q.params = append(q.params, limit)
-	return sql, q.params
+	return b.String(), q.params
 }
 
 // ========================================
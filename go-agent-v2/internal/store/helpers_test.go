@@ -0,0 +1,26 @@
+package store
+
+import "testing"
+
+func TestQueryBuilderBuild(t *testing.T) {
+	sql, params := NewQueryBuilder().
+		Eq("agent_id", "a1").
+		Eq("level", "").
+		KeywordLike("Err", "message", "source").
+		Build("SELECT * FROM logs", "ts DESC", 50)
+
+	want := "SELECT * FROM logs WHERE agent_id = $1 AND " +
+		"(LOWER(message) LIKE $2 ESCAPE E'\\\\' OR LOWER(source) LIKE $3 ESCAPE E'\\\\') " +
+		"ORDER BY ts DESC LIMIT $4"
+	if sql != want {
+		t.Fatalf("sql =\n%s\nwant\n%s", sql, want)
+	}
+	if len(params) != 4 || params[0] != "a1" || params[1] != "%err%" || params[3] != 50 {
+		t.Fatalf("params = %#v", params)
+	}
+
+	sql, params = NewQueryBuilder().Build("SELECT 1", "", 0)
+	if sql != "SELECT 1 LIMIT $1" || len(params) != 1 || params[0] != 1 {
+		t.Fatalf("empty builder = %q %#v", sql, params)
+	}
+}
@@ -5,6 +5,7 @@ package store
 import (
 	"context"
 
+	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgxpool"
 )
 
@@ -54,9 +55,20 @@ func (s *TaskDAGStore) ListDAGs(ctx context.Context, keyword, status string, lim
 	return collectRows[TaskDAG](rows)
 }
 
+// listNodesSQL 按创建顺序列出某个 DAG 的全部节点。
+const listNodesSQL = "SELECT " + nodeCols + " FROM task_dag_nodes WHERE dag_key = $1 ORDER BY created_at"
+
 // GetDAGDetail 获取 DAG + 所有节点 (对应 Python get_task_dag_detail)。
+//
+// 主表与节点两条查询经 pgx.Batch 一次发送, 只付一次网络往返。
 func (s *TaskDAGStore) GetDAGDetail(ctx context.Context, dagKey string) (*TaskDAG, []TaskDAGNode, error) {
-	dagRows, err := s.pool.Query(ctx, "SELECT "+dagCols+" FROM task_dags WHERE dag_key = $1", dagKey)
+	batch := &pgx.Batch{}
+	batch.Queue("SELECT "+dagCols+" FROM task_dags WHERE dag_key = $1", dagKey)
+	batch.Queue(listNodesSQL, dagKey)
+	br := s.pool.SendBatch(ctx, batch)
+	defer func() { _ = br.Close() }()
+
+	dagRows, err := br.Query()
 	if err != nil {
 		return nil, nil, err
 	}
@@ -64,7 +76,11 @@ func (s *TaskDAGStore) GetDAGDetail(ctx context.Context, dagKey string) (*TaskDA
 	if err != nil || dag == nil {
 		return nil, nil, err
 	}
-	nodes, err := s.ListNodes(ctx, dagKey)
+	nodeRows, err := br.Query()
+	if err != nil {
+		return nil, nil, err
+	}
+	nodes, err := collectRows[TaskDAGNode](nodeRows)
 	return dag, nodes, err
 }
 
@@ -102,10 +118,9 @@ func (s *TaskDAGStore) UpdateNodeStatus(ctx context.Context, dagKey, nodeKey, st
 	return collectOne[TaskDAGNode](rows)
 }
 
-// Deprecated: ListNodes 无外部调用者 (仅 GetDAGDetail 内部调用)。
+// Deprecated: ListNodes 无调用者 (GetDAGDetail 已改为批量查询)。
 func (s *TaskDAGStore) ListNodes(ctx context.Context, dagKey string) ([]TaskDAGNode, error) {
-	rows, err := s.pool.Query(ctx,
-		"SELECT "+nodeCols+" FROM task_dag_nodes WHERE dag_key = $1 ORDER BY created_at", dagKey)
+	rows, err := s.pool.Query(ctx, listNodesSQL, dagKey)
 	if err != nil {
 		return nil, err
 	}
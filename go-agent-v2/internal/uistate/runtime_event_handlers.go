@@ -319,6 +319,9 @@ func (m *RuntimeManager) IncrActivityStat(threadID, kind, toolName string) {
 	m.incrActivityStatLocked(threadID, kind, toolName)
 }
 
+// maxAlertsPerThread 每个线程保留的告警条数上限。
+const maxAlertsPerThread = 20
+
 // PushAlert appends a high-priority alert for the given thread.
 func (m *RuntimeManager) PushAlert(threadID, level, message string) {
 	m.mu.Lock()
@@ -335,10 +338,15 @@ func (m *RuntimeManager) pushAlertLocked(threadID, level, message string) {
 		Level:   level,
 		Message: message,
 	}
-	alerts = append(alerts, entry)
-	// 保留最近 20 条
-	if len(alerts) > 20 {
-		alerts = alerts[len(alerts)-20:]
+	// 保留最近 maxAlertsPerThread 条: 满额后原地左移一位覆盖队尾,
+	// 不再 append+重切片 (窗口右移后 cap 耗尽会周期性重新分配底层数组)。
+	// 对外快照经 cloneAlerts 深拷贝, 原地修改不影响读方。
+	if len(alerts) >= maxAlertsPerThread {
+		copy(alerts, alerts[len(alerts)-maxAlertsPerThread+1:])
+		alerts = alerts[:maxAlertsPerThread]
+		alerts[maxAlertsPerThread-1] = entry
+	} else {
+		alerts = append(alerts, entry)
 	}
 	m.snapshot.AlertsByThread[threadID] = alerts
 	m.seq++
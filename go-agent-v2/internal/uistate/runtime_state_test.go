@@ -2,6 +2,7 @@ package uistate
 
 import (
 	"math"
+	"strconv"
 	"strings"
 	"testing"
 )
@@ -1523,3 +1524,23 @@ func TestThreadStatusChanged_WaitingOnUserInput(t *testing.T) {
 		t.Fatalf("details = %q, want 等待用户输入后继续", got)
 	}
 }
+
+func TestPushAlert_KeepsLatestAlerts(t *testing.T) {
+	mgr := NewRuntimeManager()
+	threadID := "thread-alerts"
+	total := maxAlertsPerThread + 7
+	for i := 0; i < total; i++ {
+		mgr.PushAlert(threadID, "warn", "alert-"+strconv.Itoa(i))
+	}
+
+	alerts := mgr.Snapshot().AlertsByThread[threadID]
+	if len(alerts) != maxAlertsPerThread {
+		t.Fatalf("len(alerts) = %d, want %d", len(alerts), maxAlertsPerThread)
+	}
+	for i, a := range alerts {
+		want := "alert-" + strconv.Itoa(total-maxAlertsPerThread+i)
+		if a.Message != want {
+			t.Fatalf("alerts[%d].Message = %q, want %q", i, a.Message, want)
+		}
+	}
+}